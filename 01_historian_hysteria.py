@@ -1,20 +1,178 @@
-from aoc import Input, run, TestCase
-from collections import Counter
+from aoc import run, TestCase
+import heapq
+import tempfile
+from array import array
+from itertools import islice
+from pathlib import Path
+import numpy as np
+from parse_cache import cached_parse
 
+# bytes of one row, an int64 from each column
+ROW_BYTES = 16
+# smallest read buffer worth opening a run for, which caps the merge fan-in
+MIN_BLOCK_ROWS = 64
+# The sizes below are estimates read off tracemalloc, not guarantees: they
+# shift with the Python and NumPy versions, so the budget is only a target.
+# A merged value: its int64 in the block read back, plus the Python int and
+# list slot block.tolist() turns it into
+MERGE_VALUE_BYTES = 8 + 8 + 32
+# fixed cost of an open run while merging: its generator, file object, path
+# and heap entry
+RUN_OVERHEAD_BYTES = 2048
+# what the merging and NumPy's small-allocation caches hold however small
+# the runs are, set aside before the budget is split
+BASE_OVERHEAD_BYTES = 64 * 1024
 
+
+@cached_parse
 def parse(file):
-    return Input(file).as_columns(separator="   ", converter=int)
+    """
+    Both location lists as the columns of one (rows, 2) int64 array, each
+    column sorted independently in place, so a row costs 16 bytes in total.
+    """
+    # NumPy's C tokenizer parses straight into int64, with no str or int objects
+    columns = np.loadtxt(file, dtype=np.int64, ndmin=2)
+    columns.sort(axis=0)
+    return columns
+
+
+def run_path(directory, side, generation, index):
+    # runs are found by number, so no per-run objects are kept between merges
+    return Path(directory) / f"{side}.{generation}.{index}"
+
+
+def spill_sorted_runs(file, run_rows, directory):
+    """
+    Sort the input run_rows rows at a time, writing each run's sorted columns
+    to raw int64 files in directory as generation 0.
+
+    Every run is parsed by np.fromfile straight from the file into one int64
+    array of exactly run_rows rows, so no line or bytes objects are built.
+
+    Returns:
+        Number of runs per column
+    """
+    runs = 0
+    with open(file, "rb") as f:
+        while True:
+            values = np.fromfile(f, dtype=np.int64, sep=" ", count=2 * run_rows)
+            if not len(values):
+                return runs
+            columns = values.reshape(-1, 2)
+            # each column is sorted and written on its own, so the only copy
+            # alive next to the run is one column
+            for side in (0, 1):
+                column = columns[:, side].copy()
+                column.sort()
+                column.tofile(run_path(directory, side, 0, runs))
+                del column
+            del values, columns
+            runs += 1
+
+
+def read_run(path, block_rows):
+    """The values of one sorted run, read back block_rows at a time."""
+    # unbuffered: with many runs open, the default 8 KiB buffers would add up
+    with open(path, "rb", buffering=0) as f:
+        while len(block := np.fromfile(f, dtype=np.int64, count=block_rows)):
+            yield from block.tolist()
+    path.unlink()
+
+
+def merge_block_rows(memory_budget, runs):
+    """Rows each of runs open runs can buffer within memory_budget bytes."""
+    share = memory_budget // max(1, runs) - RUN_OVERHEAD_BYTES
+    return max(1, share // MERGE_VALUE_BYTES)
+
+
+def merge_runs(directory, side, runs, limit, fan_in, memory_budget):
+    """
+    Merge one column's sorted runs fan_in at a time into longer ones until at
+    most limit are left, so the final merge never holds more runs open than
+    fit in the budget.
+
+    Returns:
+        Tuple of (generation, runs) of the remaining runs
+    """
+    generation = 0
+    block_rows = merge_block_rows(memory_budget, fan_in + 1)
+    while runs > limit:
+        for index, first in enumerate(range(0, runs, fan_in)):
+            values = heapq.merge(
+                *(
+                    read_run(run_path(directory, side, generation, run), block_rows)
+                    for run in range(first, min(first + fan_in, runs))
+                )
+            )
+            path = run_path(directory, side, generation + 1, index)
+            with open(path, "wb", buffering=0) as f:
+                while block := array("q", islice(values, block_rows)):
+                    block.tofile(f)
+        generation, runs = generation + 1, index + 1
+    return generation, runs
+
+
+def external_sorted_distance(file, memory_budget):
+    """
+    part1 for inputs larger than memory: an external merge sort.
+
+    Sorted runs are spilled to temporary files, merged in passes of a bounded
+    fan-in, then the runs of both columns are k-way merged in lockstep, so
+    the i-th smallest left and right values meet without either column ever
+    being resident. A run holds its rows plus one column being sorted, and
+    the merges split the budget between the read buffers and fixed costs of
+    their open runs, so the peak stays around memory_budget bytes (the
+overheads are estimates, see RUN_OVERHEAD_BYTES and friends). Budgets
+    under about twice BASE_OVERHEAD_BYTES still give the right answer, but
+    their peak is mostly that fixed overhead and exceeds them.
+    """
+    budget = max(memory_budget - BASE_OVERHEAD_BYTES, memory_budget // 2)
+    # a run's rows, one column copy being sorted and headroom for fromfile
+    run_rows = max(1, budget // (2 * ROW_BYTES))
+    fan_in = max(
+        2, budget // (RUN_OVERHEAD_BYTES + MIN_BLOCK_ROWS * MERGE_VALUE_BYTES)
+    )
+    with tempfile.TemporaryDirectory(prefix="01_runs") as directory:
+        runs = spill_sorted_runs(file, run_rows, directory)
+        # the lockstep merge keeps both columns' runs open at once
+        limit = max(1, fan_in // 2)
+        columns = [
+            merge_runs(directory, side, runs, limit, fan_in, budget)
+            for side in (0, 1)
+        ]
+        block_rows = merge_block_rows(budget, 2 * columns[0][1])
+        xs, ys = (
+            heapq.merge(
+                *(
+                    read_run(run_path(directory, side, generation, run), block_rows)
+                    for run in range(runs)
+                )
+            )
+            for side, (generation, runs) in enumerate(columns)
+        )
+        return sum(abs(x - y) for x, y in zip(xs, ys))
 
 
-def part1(file):
-    xs, ys = parse(file)
-    return sum(abs(x - y) for x, y in zip(sorted(xs), sorted(ys)))
+def part1(file, memory_budget=None):
+    """
+    Args:
+        file: Input file
+        memory_budget: Bytes of rows to hold at once; switches to the
+            external sort for inputs that do not fit in memory
+    """
+    if memory_budget is not None:
+        return external_sorted_distance(file, memory_budget)
+    columns = parse(file)
+    return int(np.abs(columns[:, 0] - columns[:, 1]).sum())
 
 
 def part2(file):
-    xs, ys = parse(file)
-    frequencies = Counter(ys)
-    return sum(x * frequencies[x] for x in xs)
+    columns = parse(file)
+    xs, ys = columns[:, 0], columns[:, 1]
+    values, counts = np.unique(xs, return_counts=True)
+    # occurrences of every distinct left value in the sorted right column
+    matches = np.searchsorted(ys, values, "right") - np.searchsorted(ys, values)
+    return int((values * counts * matches).sum())
 
 
 if __name__ == "__main__":
@@ -23,6 +181,9 @@ if __name__ == "__main__":
         [
             TestCase("./data/01_example", 11),
             TestCase("./data/01_puzzle_input", 2066446),
+            # external sort: two rows per run
+            TestCase(("./data/01_example", 32), 11),
+            TestCase(("./data/01_puzzle_input", 1 << 16), 2066446),
         ],
     )
     run(
@@ -1,33 +1,116 @@
-from aoc import Input, extract_ints, run, TestCase
-from itertools import pairwise
+from aoc import run, TestCase
+import numpy as np
+from streaming import StreamingInput
 
 
-def parse(data_file):
-    return [extract_ints(line) for line in Input(data_file).as_lines()]
+def parse_ragged(data_file):
+    """
+    All reports as one ragged array.
+
+    Returns:
+        Tuple of (values, starts, ends) where report i is
+        ``values[starts[i]:ends[i]]``; blank lines are dropped
+    """
+    with StreamingInput(data_file) as data:
+        values, offsets = data.as_int_array(rows=True)
+    starts, ends = offsets[:-1], offsets[1:]
+    nonempty = ends > starts
+    return values, starts[nonempty], ends[nonempty]
+
+
+def first_violation(report, direction, skip=None, start=0):
+    """
+    Find the first step that does not move 1 to 3 levels in direction.
+
+    Args:
+        report: List of levels
+        direction: 1 for increasing, -1 for decreasing
+        skip: Index of a level to leave out, the dampener's removal
+        start: Index to start checking from
+
+    Returns:
+        Index of the step's first level, or None if every step is safe
+    """
+    previous = None
+    for i in range(start, len(report)):
+        if i == skip:
+            continue
+        if previous is not None:
+            step = direction * (report[i] - report[previous])
+            if not 1 <= step <= 3:
+                return previous
+        previous = i
+    return None
+
+
+# is_safe and is_safe_dampered check a single report. The parts classify all
+# reports at once with safe_reports, which tests/ checks against these.
 
 
 def is_safe(report):
-    diffs = list(map(lambda xs: xs[0] - xs[1], pairwise(report)))
-    all_positive = all(diff > 0 for diff in diffs)
-    all_negative = all(diff < 0 for diff in diffs)
-    all_within_bounds = all(abs(diff) > 0 and abs(diff) < 4 for diff in diffs)
-    return all_within_bounds and (all_positive or all_negative)
+    return any(first_violation(report, direction) is None for direction in (1, -1))
 
 
 def is_safe_dampered(report):
-    if is_safe(report):
-        return True
-    damped_reports = [report[:i] + report[i + 1 :] for i in range(len(report))]
-    results = map(is_safe, damped_reports)
-    return any(results)
+    for direction in (1, -1):
+        bad = first_violation(report, direction)
+        if bad is None:
+            return True
+        # one of the two levels of the first bad step has to go; everything
+        # before it already checked out, so rescan from just before the gap
+        if first_violation(report, direction, bad, max(bad - 1, 0)) is None:
+            return True
+        if first_violation(report, direction, bad + 1, bad) is None:
+            return True
+    return False
+
+
+def safe_reports(values, starts, ends, dampened=False):
+    """
+    is_safe, or is_safe_dampered, of every report of a ragged array at once.
+
+    Per direction, a prefix count of bad steps over the flat diffs gives the
+    bad steps of any span of a report in O(1). Removing level k leaves the
+    steps before k-1, the steps after k+1 and the bridging step from k-1 to
+    k+1, so every possible removal is checked with a few array operations.
+    Steps that cross from one report into the next fall outside every span.
+
+    Returns:
+        Boolean array with one entry per report
+    """
+    lengths = ends - starts
+    first = np.repeat(starts, lengths)
+    last = np.repeat(ends, lengths) - 1
+    level = np.arange(len(values))
+    diffs = np.diff(values)
+    # level k - 1 to level k + 1, defined for levels strictly inside a report
+    bridges = np.zeros(len(values), dtype=values.dtype)
+    bridges[1:-1] = values[2:] - values[:-2]
+    has_bridge = (level > first) & (level < last)
+
+    safe = np.zeros(len(starts), dtype=bool)
+    for direction in (1, -1):
+        bad = ~((direction * diffs >= 1) & (direction * diffs <= 3))
+        # bad_before[j] counts the bad steps among steps 0..j-1
+        bad_before = np.concatenate(([0], np.cumsum(bad)))
+        if not dampened:
+            safe |= bad_before[ends - 1] == bad_before[starts]
+            continue
+        left = bad_before[np.maximum(level - 1, first)] - bad_before[first]
+        right = bad_before[last] - bad_before[np.minimum(level + 1, last)]
+        bridge = direction * bridges
+        bridge_ok = ~has_bridge | ((bridge >= 1) & (bridge <= 3))
+        removable = (left == 0) & (right == 0) & bridge_ok
+        safe |= np.logical_or.reduceat(removable, starts)
+    return safe
 
 
 def part1(file):
-    return sum(map(is_safe, parse(file)))
+    return int(safe_reports(*parse_ragged(file)).sum())
 
 
 def part2(file):
-    return sum(map(is_safe_dampered, parse(file)))
+    return int(safe_reports(*parse_ragged(file), dampened=True).sum())
 
 
 if __name__ == "__main__":
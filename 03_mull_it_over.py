@@ -1,49 +1,62 @@
-from aoc import Input, run, TestCase
-from re import findall
-
-
-def mul(match):
-    return int(match[0]) * int(match[1])
-
-
-def score(multiplies):
-    return sum(map(mul, multiplies))
-
-
-def apply_do_and_dont(matches):
-    include = True
-    for match in matches:
-        if match == "don't()":
-            include = False
-        elif match == "do()":
-            include = True
-        elif include:
-            yield tuple(findall(r"\d+", match))
-
-
-def part1(data_file):
-    pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-    # find all returns tuple of (x,y)
-    multiplies = findall(pattern, Input(data_file).content)
-    return score(multiplies)
-
-
-def part2(data_file):
-    pattern = r"(mul\(\d{1,3},\d{1,3}\))|(do\(\))|(don't\(\))"
-    # flatten since findall returns a tuple per match ('mul(x,y)','do()', "don't()")
-    instructions = [
-        m[0] or m[1] or m[2] for m in findall(pattern, Input(data_file).content)
-    ]
-    multiplies = apply_do_and_dont(instructions)
-    return score(multiplies)
+from aoc import run, TestCase
+import re
+
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+# longest instruction, mul(123,456)
+MAX_INSTRUCTION = len(b"mul(123,456)")
+CHUNK_SIZE = 1 << 20
+
+
+def scan(data_file, conditional, chunk_size=CHUNK_SIZE):
+    """
+    Sum the products of the mul instructions, reading chunk_size bytes at a time.
+
+    An instruction can straddle two chunks, so the tail of every chunk after
+    its last match is carried over and scanned again with the next one. At
+    most MAX_INSTRUCTION - 1 bytes need carrying, as anything longer would
+    already hold a complete match. Instructions cannot nest, so a match is
+    never part of an unfinished one starting earlier.
+
+    Args:
+        data_file: Input file
+        conditional: Obey do() and don't(), otherwise every mul counts
+        chunk_size: Bytes per chunk
+    """
+    total = 0
+    enabled = True
+    carry = b""
+    with open(data_file, "rb") as f:
+        while chunk := f.read(chunk_size):
+            buffer = carry + chunk
+            end = 0
+            for match in INSTRUCTION.finditer(buffer):
+                end = match.end()
+                if match[1] is not None:
+                    if enabled or not conditional:
+                        total += int(match[1]) * int(match[2])
+                else:
+                    enabled = match[0] == b"do()"
+            carry = buffer[max(end, len(buffer) - MAX_INSTRUCTION + 1) :]
+    return total
+
+
+def part1(data_file, chunk_size=CHUNK_SIZE):
+    return scan(data_file, False, chunk_size)
+
+
+def part2(data_file, chunk_size=CHUNK_SIZE):
+    return scan(data_file, True, chunk_size)
 
 
 if __name__ == "__main__":
     run(part1, [
         TestCase("./data/03_example", 161),
         TestCase("./data/03_puzzle_input", 170807108),
+        # chunks smaller than an instruction split nearly every one of them
+        TestCase(("./data/03_example", 5), 161),
     ])
     run(part2, [
         TestCase("./data/03_example2", 48),
         TestCase("./data/03_puzzle_input", 74838033),
+        TestCase(("./data/03_example2", 5), 48),
     ])
@@ -1,6 +1,8 @@
 from aoc import Input, run, TestCase, Coord, Grid
+from parse_cache import cached_parse
 
 
+@cached_parse
 def parse(data_file):
     return Input(data_file).as_grid()
 
@@ -1,7 +1,10 @@
-from aoc import Input, run, TestCase, Coord
+from aoc import Input, run, TestCase, Coord, Dimension
 from multiprocessing import Pool, cpu_count
+from parse_cache import cached_parse
+from flat_grid import FlatGrid
 
 
+@cached_parse
 def parse(data_file):
     GUARD_CHAR = "^"
     OBSTRUCTION_CHAR = "#"
@@ -25,17 +28,28 @@ def parse(data_file):
 
 
 def find_path_unique_coords(direction, coord, obstructions, limits):
-    unique_coords = set()
-    while coord.in_bounds(limits):
-        next_coord = coord + direction
-        if next_coord in obstructions:
+    # Walk on packed cells and heading numbers so the loop allocates no Coords
+    grid = FlatGrid.create(Dimension(limits.row + 1, limits.col + 1), False)
+    if coord not in grid:
+        return set()
+    for obstruction in obstructions:
+        grid[obstruction] = True
+
+    directions = Coord.DIRECTIONS_CARDINAL
+    turn = [directions.index(Coord.TURN_CLOCKWISE[d]) for d in directions]
+    table, blocked = grid.neighbor_table(directions), grid.cells
+    cell, heading = grid.index(coord), directions.index(direction)
+    unique_cells = set()
+    while cell >= 0:
+        ahead = table[cell * len(directions) + heading]
+        if ahead >= 0 and blocked[ahead]:
             # Obstructed must turn
-            direction = Coord.TURN_CLOCKWISE[direction]
+            heading = turn[heading]
         else:
             # Unobstructed must advance
-            unique_coords.add(coord)
-            coord = next_coord
-    return unique_coords
+            unique_cells.add(cell)
+            cell = ahead
+    return {grid.coord(cell) for cell in unique_cells}
 
 
 def build_jump_table(obstructions, limits):
@@ -1,92 +1,82 @@
-from aoc import Input, run, TestCase, Coord, Grid
+from aoc import Input, run, TestCase, Coord
 from collections import deque
+from flat_grid import FlatGrid
+from memo import BoundedMemo
 
 
-def find_paths_rec(
-    matrix, start, current_path, is_valid_step, is_end, directions, memo
-):
+def count_paths(grid, start, memo):
     """
-    Generalized algorithm to find paths in a grid.
-
-    Args:
-        grid: 2D list representing the grid.
-        row, col: Current position in the grid.
-        current_path: List of (row, col) tuples representing the current path.
-        memo: Dictionary to store previously computed results.
-        is_valid_step: Function to validate a step (grid, row, col, next_row, next_col).
-        is_end: Function to check if a position is the end condition (grid, row, col).
-
-    Returns:
-        A set of unique paths (as tuples of (row, col)).
+    Number of distinct hiking trails from packed cell start up to a 9.
+
+    The trails from a cell do not depend on how it was reached, so counts are
+    memoised per cell and shared by every trailhead whose trails pass it.
     """
-    key = (start, tuple(current_path))
-    if key in memo:
-        return memo[key]
-
-    if is_end(matrix, start):
-        return {tuple(current_path)}
-
-    paths = set()
-    for direction in directions:
-        next = start + direction
-        if next in matrix and is_valid_step(matrix, start, next):
-            paths |= find_paths_rec(
-                matrix,
-                next,
-                current_path + [next],
-                is_valid_step,
-                is_end,
-                directions,
-                memo,
-            )
-
-    memo[key] = paths
-    return paths
+    if start in memo:
+        return memo[start]
+
+    heights = grid.cells
+    if heights[start] == 9:
+        return 1
+
+    neighbors = grid.neighbor_table()
+    degree = len(Coord.DIRECTIONS_CARDINAL)
+    base = start * degree
+    count = sum(
+        count_paths(grid, next_index, memo)
+        for next_index in neighbors[base : base + degree]
+        if next_index >= 0 and heights[next_index] == heights[start] + 1
+    )
+    memo[start] = count
+    return count
 
 
 def bfs(grid, start, directions, can_visit):
     """
-    Perform BFS on a grid.
+    Perform BFS on a grid, over packed cell indices.
 
-    :param grid: Grid instance
-    :param start: Coord representing the starting position
+    :param grid: FlatGrid instance
+    :param start: packed index of the starting position
     :param directions: list of coordinate offsets for each possible direction
-    :return: List of visited positions in BFS order
+    :param can_visit: predicate on (current, next) packed indices
+    :return: List of visited packed indices in BFS order
     """
+    neighbors = grid.neighbor_table(directions)
+    degree = len(directions)
     queue = deque([start])
-    visited = set([start])
+    visited = {start}
     order = []
     while queue:
         current = queue.popleft()
         order.append(current)
 
-        for direction in directions:
-            next_coord = current + direction
+        base = current * degree
+        for next_index in neighbors[base : base + degree]:
             # Check bounds and if the cell has not been visited
             if (
-                next_coord in grid
-                and next_coord not in visited
-                and can_visit(current, next_coord)
+                next_index >= 0
+                and next_index not in visited
+                and can_visit(current, next_index)
             ):
-                visited.add(next_coord)
-                queue.append(next_coord)
+                visited.add(next_index)
+                queue.append(next_index)
 
     return order
 
 
 def parse(data_file):
     # problem wants to follow path of increasing values from 0, so EMPTY = -1
-    return Input(data_file).as_int_grid(empty_value=-1)
+    return FlatGrid.from_int_lines(Input(data_file).as_lines(), empty_value=-1)
 
 
 def find_reachable_nines(topographic_map, start_coord):
+    heights = topographic_map.cells
     paths = bfs(
         topographic_map,
-        start_coord,
+        topographic_map.index(start_coord),
         Coord.DIRECTIONS_CARDINAL,
-        lambda p, n: topographic_map[p] + 1 == topographic_map[n],
+        lambda p, n: heights[p] + 1 == heights[n],
     )
-    nines = [coord for coord in set(paths) if topographic_map[coord] == 9]
+    nines = [index for index in paths if heights[index] == 9]
     return len(nines)
 
 
@@ -94,26 +84,8 @@ def find_trailheads(topographic_map):
     return topographic_map.find_all(0)
 
 
-def is_valid_step(grid, current_coord, next_coord):
-    return grid[next_coord] == grid[current_coord] + 1
-
-
-def is_end_of_path(grid, coord):
-    return grid[coord] == 9
-
-
-def find_path_count(matrix, start):
-    return len(
-        find_paths_rec(
-            matrix,
-            start,
-            [start],
-            is_valid_step,
-            is_end_of_path,
-            Coord.DIRECTIONS_CARDINAL,
-            dict(),
-        )
-    )
+def find_path_count(topographic_map, start_coord, memo):
+    return count_paths(topographic_map, topographic_map.index(start_coord), memo)
 
 
 def answer(file, path_function):
@@ -128,7 +100,8 @@ def part1(file):
 
 
 def part2(file):
-    return answer(file, find_path_count)
+    memo = BoundedMemo("10 count_paths", maxsize=1 << 16)
+    return answer(file, lambda grid, start: find_path_count(grid, start, memo))
 
 
 # =============================================================================
@@ -1,6 +1,9 @@
-from aoc import Input, run, TestCase, Coord, Grid, count_continuous_segments
+from aoc import Input, run, TestCase, Coord, count_continuous_segments
+from array import array
 from collections import deque
 from dataclasses import dataclass
+from flat_grid import FlatGrid
+from parse_cache import cached_parse
 
 
 @dataclass
@@ -10,48 +13,53 @@ class Region:
     perimeter: int
 
 
-def parse(data_file: str) -> Grid:
-    return Input(data_file).as_grid()
+@cached_parse
+def parse(data_file: str) -> FlatGrid:
+    return FlatGrid.from_lines(Input(data_file).as_lines())
 
 
-def is_valid_and_same_plant(coord: Coord, plant: str, grid: Grid) -> bool:
+def is_valid_and_same_plant(coord: Coord, plant: str, grid: FlatGrid) -> bool:
     """Check if cell is valid and contains the same plant type."""
     return coord in grid and grid[coord] == plant
 
 
 def flood_fill_region(
-    start: Coord,
-    plant: str,
-    grid: Grid,
-    visited: Grid,
+    start: int,
+    grid: FlatGrid,
+    visited: FlatGrid,
+    neighbors: array,
 ) -> tuple[int, int]:
     """
     Use flood fill (DFS) to find all cells in a region and calculate area/perimeter.
 
+    Works on packed cell indices so the inner loop allocates no Coords.
+
     Args:
-        start: Starting coordinate
-        plant: Plant type for this region
+        start: Packed index of the starting cell
         grid: 2D grid of plant types
         visited: Tracking visited cells
+        neighbors: Packed cardinal neighbour table of the grid
 
     Returns:
         Tuple of (area, perimeter)
     """
+    plants, seen = grid.cells, visited.cells
+    plant = plants[start]
     stack = [start]
-    visited[start] = True
+    seen[start] = True
     area, perimeter = 0, 0
+    degree = len(Coord.DIRECTIONS_CARDINAL)
 
     while stack:
         current = stack.pop()
         area += 1
 
-        for direction in Coord.DIRECTIONS_CARDINAL:
-            neighbor = current + direction
-
-            if is_valid_and_same_plant(neighbor, plant, grid):
-                if not visited[neighbor]:
+        base = current * degree
+        for neighbor in neighbors[base : base + degree]:
+            if neighbor >= 0 and plants[neighbor] == plant:
+                if not seen[neighbor]:
                     stack.append(neighbor)
-                    visited[neighbor] = True
+                    seen[neighbor] = True
             else:
                 # Either out of bounds or different plant - counts as perimeter
                 perimeter += 1
@@ -105,23 +113,21 @@ def count_sides_from_boundaries(boundaries: set[tuple[tuple[int, int], str]]) ->
     return total_sides
 
 
-def calculate_area_and_perimeter(grid: Grid) -> list[Region]:
+def calculate_area_and_perimeter(grid: FlatGrid) -> list[Region]:
     """
     Find all regions in the grid and calculate their areas and perimeters.
 
     A region is a connected group of cells with the same plant type.
     Perimeter counts edges that border different plants or the grid boundary.
     """
-    visited = Grid.create(grid.size, False)
+    visited = FlatGrid.create(grid.size, False)
+    neighbors = grid.neighbor_table()
     results = []
 
-    for r in range(grid.size.height):
-        for c in range(grid.size.width):
-            coord = Coord.from_rc(r, c)
-            if not visited[coord]:
-                plant = grid[coord]
-                area, perimeter = flood_fill_region(coord, plant, grid, visited)
-                results.append(Region(plant, area, perimeter))
+    for index in range(len(grid.cells)):
+        if not visited[index]:
+            area, perimeter = flood_fill_region(index, grid, visited, neighbors)
+            results.append(Region(grid[index], area, perimeter))
 
     return results
 
@@ -134,8 +140,8 @@ def price_perimeter(file: str) -> int:
 
 def find_region_cells(
     start: Coord,
-    grid: Grid,
-    visited: Grid,
+    grid: FlatGrid,
+    visited: FlatGrid,
 ) -> list[Coord]:
     """Find all cells in the same region using BFS."""
     queue = deque([start])
@@ -159,7 +165,7 @@ def find_region_cells(
     return region_cells
 
 
-def count_perimeter_sides(cells: list[Coord], grid: Grid) -> int:
+def count_perimeter_sides(cells: list[Coord], grid: FlatGrid) -> int:
     """Count perimeter sides for a region."""
     sides = 0
     for coord in cells:
@@ -171,55 +177,60 @@ def count_perimeter_sides(cells: list[Coord], grid: Grid) -> int:
     return sides
 
 
-def calculate_area_and_sides(grid: Grid) -> list[tuple[str, int, int]]:
+def calculate_area_and_sides(grid: FlatGrid) -> list[tuple[str, int, int]]:
     """Calculate area and sides for each region using flood fill with direction tracking."""
-    visited = Grid.create(grid.size, False)
-
-    def flood_fill(start: Coord, plant: str) -> tuple[int, int]:
+    visited = FlatGrid.create(grid.size, False)
+
+    plants, seen = grid.cells, visited.cells
+    neighbors = grid.neighbor_table()
+    direction_map = {
+        Coord.UP: "U",
+        Coord.DOWN: "D",
+        Coord.LEFT: "L",
+        Coord.RIGHT: "R",
+    }
+    # neighbour table order follows DIRECTIONS_CARDINAL
+    direction_names = [direction_map[d] for d in Coord.DIRECTIONS_CARDINAL]
+    degree = len(direction_names)
+
+    def flood_fill(start: int) -> tuple[int, int]:
+        plant = plants[start]
         stack = [start]
-        visited[start] = True
+        seen[start] = True
         area = 0
         boundaries = set()  # Store all boundary edges as unique segments
 
-        direction_map = {
-            Coord.UP: "U",
-            Coord.DOWN: "D",
-            Coord.LEFT: "L",
-            Coord.RIGHT: "R",
-        }
-
         while stack:
             current = stack.pop()
             area += 1
             # Check all 4 directions
-            for direction in Coord.DIRECTIONS_CARDINAL:
-                neighbor = current + direction
-                if is_valid_and_same_plant(neighbor, plant, grid):
-                    if not visited[neighbor]:
+            base = current * degree
+            for name, neighbor in zip(
+                direction_names, neighbors[base : base + degree]
+            ):
+                if neighbor >= 0 and plants[neighbor] == plant:
+                    if not seen[neighbor]:
                         stack.append(neighbor)
-                        visited[neighbor] = True
+                        seen[neighbor] = True
                 else:
                     # Out of bounds or different plant - add boundary segment
-                    boundaries.add(((current.row, current.col), direction_map[direction]))
+                    boundaries.add((divmod(current, grid.width), name))
 
         # Count continuous sides from boundary edges
         sides = count_sides_from_boundaries(boundaries)
         return area, sides
 
     results = []
-    for r in range(grid.size.height):
-        for c in range(grid.size.width):
-            coord = Coord.from_rc(r, c)
-            if not visited[coord]:
-                plant = grid[coord]
-                area, sides = flood_fill(coord, plant)
-                results.append((plant, area, sides))
+    for index in range(len(plants)):
+        if not seen[index]:
+            area, sides = flood_fill(index)
+            results.append((grid[index], area, sides))
     return results
 
 
-def calculate_total_price(grid: Grid) -> int:
+def calculate_total_price(grid: FlatGrid) -> int:
     """Calculate total price for all regions (area * perimeter)."""
-    visited = Grid.create(grid.size, False)
+    visited = FlatGrid.create(grid.size, False)
     total_price = 0
 
     for r in range(grid.size.height):
@@ -1,15 +1,13 @@
 import numpy as np
 from math import isclose
-from aoc import Input, extract_ints, run, TestCase
-
-
-def split_list(xs, n):
-    return [xs[i : i + n] for i in range(0, len(xs), n)]
+from aoc import run, TestCase
+from streaming import StreamingInput
 
 
 def parse(data_file):
-    text = Input(data_file).content
-    return split_list(extract_ints(text), 6)
+    # six numbers per machine: button A, button B, prize
+    with StreamingInput(data_file) as data:
+        return data.as_int_array().reshape(-1, 6).tolist()
 
 
 tol = 0.00000000000001
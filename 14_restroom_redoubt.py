@@ -1,13 +1,11 @@
-from aoc import Input, extract_ints, run, TestCase
-
-
-def parse_line(line):
-    px, py, vx, vy = extract_ints(line)
-    return ((px, py), (vx, vy))
+from aoc import run, TestCase
+from streaming import StreamingInput
 
 
 def parse_file(data_file):
-    return [parse_line(line) for line in Input(data_file).as_lines()]
+    with StreamingInput(data_file) as data:
+        robots = data.as_int_array().reshape(-1, 4).tolist()
+    return [((px, py), (vx, vy)) for px, py, vx, vy in robots]
 
 
 def simulate_robot_positions(robots, seconds, width, height):
@@ -1,118 +1,59 @@
-from aoc import Input, run, TestCase, Coord, Grid, dijkstra
+from aoc import Input, run, TestCase, Coord
+from csr import UNREACHED, compile_heading_grid, dijkstra, shortest_path_nodes
+from flat_grid import FlatGrid
 
 EAST = Coord.DIRECTIONS_CARDINAL.index(Coord.RIGHT)
+OPEN = {".", "S", "E"}
+FORWARD_COST = 1
+DIRECTION_COST = 1000
 
 
 def parse(data_file):
-    grid = Input(data_file).as_grid()
+    grid = FlatGrid.from_lines(Input(data_file).as_lines())
     start = grid.find_first("S")
     end = grid.find_first("E")
     return grid, start, end
 
 
-def find_lowest_score(grid, start, end):
-    direction_cost = 1000
-    forward_cost = 1
-
-    def neighbors_func(state):
-        """Return list of (next_state, cost) tuples."""
-        coord, direction = state
-        neighbors = []
+def search_maze(grid, start, end):
+    """
+    Score every (tile, direction) state reachable from the start facing east.
 
-        # Try moving forward
-        dc = Coord.DIRECTIONS_CARDINAL[direction]
-        nc = coord + dc
-        if nc in grid and grid[nc] != "#":
-            neighbors.append(((nc, direction), forward_cost))
+    The maze is compiled once into a CSR graph over ``tile * 4 + direction``
+    states, so dijkstra never rebuilds neighbour lists.
 
-        # Try rotating left and right
-        for turn in [-1, 1]:
-            new_direction = (direction + turn) % 4
-            neighbors.append(((coord, new_direction), direction_cost))
+    Returns:
+        Tuple of (graph, scores, end_states) where end_states are the states on
+        the end tile with the lowest score
+    """
+    graph = compile_heading_grid(grid, OPEN, FORWARD_COST, DIRECTION_COST)
+    scores = dijkstra(graph, grid.index(start) * 4 + EAST)
 
-        return neighbors
+    end_tile = grid.index(end)
+    reached = [
+        state
+        for state in range(end_tile * 4, end_tile * 4 + 4)
+        if scores[state] != UNREACHED
+    ]
+    if not reached:
+        return graph, scores, []
+    min_end_score = min(scores[state] for state in reached)
+    return graph, scores, [s for s in reached if scores[s] == min_end_score]
 
-    # Use generalized dijkstra with (coord, direction) state tuples
-    start_state = (start, EAST)
-    distances = dijkstra(start_state, neighbors_func)
 
-    # Find minimum distance to end in any direction
-    return min(
-        distances.get((end, d), float('inf'))
-        for d in range(4)
-    )
+def find_lowest_score(grid, start, end):
+    _, scores, end_states = search_maze(grid, start, end)
+    if not end_states:
+        return float('inf')
+    return scores[end_states[0]]
 
 
 def find_all_best_path_tiles(grid, start, end):
     """Find all tiles that are part of at least one best path."""
-    direction_cost = 1000
-    forward_cost = 1
-
-    def neighbors_func(state):
-        """Return list of (next_state, cost) tuples."""
-        coord, direction = state
-        neighbors = []
-
-        # Try moving forward
-        dc = Coord.DIRECTIONS_CARDINAL[direction]
-        nc = coord + dc
-        if nc in grid and grid[nc] != "#":
-            neighbors.append(((nc, direction), forward_cost))
-
-        # Try rotating left and right
-        for turn in [-1, 1]:
-            new_direction = (direction + turn) % 4
-            neighbors.append(((coord, new_direction), direction_cost))
-
-        return neighbors
-
-    # First pass: find the minimum score to reach each (coord, direction) state
-    start_state = (start, EAST)
-    best_scores = dijkstra(start_state, neighbors_func)
-
-    # Find the minimum score to reach the end in any direction
-    min_end_score = min(
-        best_scores.get((end, d), float('inf'))
-        for d in range(4)
-    )
-
-    # Second pass: backtrack from end to find all tiles on best paths
-    tiles_on_best_paths = set()
-    # Start from all end states with the minimum score
-    backtrack_queue = [
-        (end, d) for d in range(4)
-        if best_scores.get((end, d), float('inf')) == min_end_score
-    ]
-    visited_backtrack = set(backtrack_queue)
-
-    while backtrack_queue:
-        coord, direction = backtrack_queue.pop(0)
-        tiles_on_best_paths.add(coord)
-        current_score = best_scores[(coord, direction)]
-
-        # Check if we can reverse the forward move
-        dc = Coord.DIRECTIONS_CARDINAL[direction]
-        prev_coord = coord - dc
-
-        if prev_coord in grid and grid[prev_coord] != "#":
-            prev_state = (prev_coord, direction)
-            expected_score = current_score - forward_cost
-            if prev_state in best_scores and best_scores[prev_state] == expected_score:
-                if prev_state not in visited_backtrack:
-                    visited_backtrack.add(prev_state)
-                    backtrack_queue.append(prev_state)
-
-        # Check if we rotated to get here
-        for turn in [-1, 1]:
-            prev_direction = (direction - turn) % 4
-            prev_state = (coord, prev_direction)
-            expected_score = current_score - direction_cost
-            if prev_state in best_scores and best_scores[prev_state] == expected_score:
-                if prev_state not in visited_backtrack:
-                    visited_backtrack.add(prev_state)
-                    backtrack_queue.append(prev_state)
-
-    return len(tiles_on_best_paths)
+    graph, scores, end_states = search_maze(grid, start, end)
+    # backtrack from the end over the edges that best paths used
+    states = shortest_path_nodes(graph, scores, end_states)
+    return len({state // 4 for state in states})
 
 
 def part1(file):
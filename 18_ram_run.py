@@ -1,4 +1,11 @@
-from aoc import Input, run, TestCase, Coord, Dimension, Grid, bfs
+from aoc import Input, run, TestCase, Dimension
+from functools import cache
+from csr import UNREACHED, astar, bidirectional_bfs, compile_grid, manhattan
+from flat_grid import FlatGrid
+
+
+# translate() table turning the grid's cells into a blocked mask
+FALLEN = bytes(1 if byte == ord("#") else 0 for byte in range(256))
 
 
 def parse_input(data_file):
@@ -6,8 +13,7 @@ def parse_input(data_file):
 
 
 def simulate_memory_space(grid_size, byte_positions, total_bytes):
-    # Initialize the grid using aoc utility
-    grid = Grid.create(Dimension(grid_size, grid_size), ".")
+    grid = FlatGrid.create(Dimension(grid_size, grid_size), ".")
 
     # Corrupt the grid based on the incoming bytes
     for i in range(min(total_bytes, len(byte_positions))):
@@ -18,24 +24,26 @@ def simulate_memory_space(grid_size, byte_positions, total_bytes):
     return grid
 
 
-def find_shortest_path(grid):
-    start = Coord.from_rc(0, 0)
-    end = Coord.from_rc(grid.size.height - 1, grid.size.width - 1)
+@cache
+def empty_space(grid_size):
+    """
+    The memory space before any byte falls and its compiled graph.
 
-    # Define neighbors function for BFS
-    def neighbors_func(coord):
-        return [
-            neighbor
-            for direction in Coord.DIRECTIONS_CARDINAL
-            if (neighbor := coord + direction) in grid
-            and grid[neighbor] == "."
-        ]
+    Built once per size and shared by every query of both parts, which mask
+    the fallen bytes instead of compiling the corrupted grid again.
+    """
+    space = FlatGrid.create(Dimension(grid_size, grid_size), ".")
+    return space, compile_grid(space, {"."})
 
-    # Use aoc.bfs() to find distances
-    distances = bfs(start, neighbors_func)
 
-    # Return distance to end, or -1 if not found
-    return distances.get(end, -1)
+def find_shortest_path(grid):
+    """Steps from the top left to the bottom right corner, or -1 if unreachable."""
+    _, graph = empty_space(grid.width)
+    blocked = grid.cells.translate(FALLEN)
+    # the exit is the last packed cell; A* only expands cells heading its way
+    end = len(grid.cells) - 1
+    distance = astar(graph, 0, end, manhattan(grid, end), blocked)
+    return -1 if distance == UNREACHED else distance
 
 
 def find_blocking_byte(grid_size, byte_positions):
@@ -49,6 +57,11 @@ def find_blocking_byte(grid_size, byte_positions):
 
     Returns the coordinates as a string "x,y"
     """
+    # each probe only masks the fallen bytes in the compiled empty space
+    space, graph = empty_space(grid_size)
+    end = len(space.cells) - 1
+    byte_cells = [space.index(c) if c in space else -1 for c in byte_positions]
+
     left = 0
     right = len(byte_positions) - 1
     result = None
@@ -57,8 +70,12 @@ def find_blocking_byte(grid_size, byte_positions):
         mid = (left + right) // 2
 
         # Test with mid bytes
-        grid = simulate_memory_space(grid_size, byte_positions, mid + 1)
-        path_exists = find_shortest_path(grid) != -1
+        blocked = bytearray(len(space.cells))
+        for cell in byte_cells[: mid + 1]:
+            if cell >= 0:
+                blocked[cell] = 1
+        # only reachability matters, so meet in the middle and stop early
+        path_exists = bidirectional_bfs(graph, 0, end, blocked) != UNREACHED
 
         if path_exists:
             # Path still exists, try more bytes
@@ -1,4 +1,5 @@
 from aoc import Input, run, TestCase
+from memo import BoundedMemo
 
 
 def parse_input(data_file):
@@ -10,7 +11,8 @@ def parse_input(data_file):
 
 def count_possible_arrangements(pattern, available_patterns, memo=None, start=0):
     if memo is None:
-        memo = {}
+        # one table per design; at most len(pattern) + 1 start offsets
+        memo = BoundedMemo("19 count_possible_arrangements")
 
     if start == len(pattern):
         return 1
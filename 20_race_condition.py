@@ -1,4 +1,6 @@
-from aoc import Input, run, TestCase, Coord, Grid, dfs_grid_path
+from aoc import Input, run, TestCase, Coord, Dimension, Grid, dfs_grid_path
+from flat_grid import FlatGrid
+from parse_cache import cached_parse
 
 WALL = "#"
 SPACE = "."
@@ -6,32 +8,51 @@ START = "S"
 END = "E"
 
 
+@cached_parse
 def parse(data_file):
     return Input(data_file).as_grid()
 
 
+def path_positions(maze, path, margin):
+    """
+    Position along the path of every cell, in a FlatGrid padded by margin cells
+    on every side.
+
+    Any packed offset of up to margin steps from a path cell stays inside the
+    padded grid and needs no bounds check. Cells off the path hold -1.
+
+    Returns:
+        Tuple of (positions, packed path cells)
+    """
+    size = Dimension(maze.size.height + 2 * margin, maze.size.width + 2 * margin)
+    positions = FlatGrid.create(size, -1)
+    corner = Coord.from_rc(margin, margin)
+    cells = [positions.index(coord + corner) for coord in path]
+    for i, cell in enumerate(cells):
+        positions[cell] = i
+    return positions, cells
+
+
 def analyze_maze(maze, start, end):
     path = dfs_grid_path(maze, start, end, {SPACE, END})
     if not path:
         raise ValueError("No valid path between start and end in the original maze.")
-    path_index_by_coord = {coord: i for i, coord in enumerate(path)}
+    grid, cells = path_positions(maze, path, 2)
+    positions, directions = grid.cells, grid.deltas()
     savings_count = {}
-    for current_index, current_coord in enumerate(path):
-        # look in cardinal directions for walls
-        for direction in Coord.DIRECTIONS_CARDINAL:
-            check_for_wall = current_coord + direction
-            if check_for_wall in maze and maze[check_for_wall] == WALL:
+    for current_index, here in enumerate(cells):
+        # look in cardinal directions for walls (every off-path cell is a wall)
+        for direction in directions:
+            if positions[here + direction] < 0:
                 # then one more in same direction for non wall
-                check_for_space = check_for_wall + direction
-                if check_for_space in maze and maze[check_for_space] != WALL:
-                    space_index = path_index_by_coord[check_for_space]
-                    savings_index = space_index - current_index
-                    if savings_index > 0:
-                        # check index existence
-                        if savings_index not in savings_count:
-                            savings_count[savings_index] = 0
-                        # increment count for savings amount
-                        savings_count[savings_index] += 1
+                space_index = positions[here + 2 * direction]
+                savings_index = space_index - current_index
+                if space_index >= 0 and savings_index > 0:
+                    # check index existence
+                    if savings_index not in savings_count:
+                        savings_count[savings_index] = 0
+                    # increment count for savings amount
+                    savings_count[savings_index] += 1
 
     return savings_count
 
@@ -41,41 +62,40 @@ def analyze_maze_with_longer_cheats(maze, start, end, max_cheat_duration):
     Find cheats that can last up to max_cheat_duration picoseconds.
     A cheat is defined by its start and end positions on the path.
     The cheat duration is the Manhattan distance between start and end.
-    Optimized to calculate distance directly and skip impossible cheats early.
+    Optimized to precompute the packed offsets of the cheat diamond once and
+    look cheat ends up in a padded position array instead of a Coord dict.
     """
     path = dfs_grid_path(maze, start, end, {SPACE, END})
     if not path:
         raise ValueError("No valid path between start and end in the original maze.")
 
-    path_index_by_coord = {coord: i for i, coord in enumerate(path)}
+    grid, cells = path_positions(maze, path, max_cheat_duration)
+    positions = grid.cells
+
+    # All offsets within Manhattan distance of max_cheat_duration, with their duration
+    diamond = [
+        Coord.from_rc(drow, dcol)
+        for drow in range(-max_cheat_duration, max_cheat_duration + 1)
+        for dcol in range(
+            -(max_cheat_duration - abs(drow)), max_cheat_duration - abs(drow) + 1
+        )
+        if drow or dcol
+    ]
+    cheats = [
+        (offset, abs(d.row) + abs(d.col))
+        for offset, d in zip(grid.deltas(diamond), diamond)
+    ]
     savings_count = {}
 
     # For each position on the path
-    for current_index, current_coord in enumerate(path):
-        # Check all positions within Manhattan distance of max_cheat_duration
-        for drow in range(-max_cheat_duration, max_cheat_duration + 1):
-            remaining = max_cheat_duration - abs(drow)
-            for dcol in range(-remaining, remaining + 1):
-                # Calculate manhattan distance directly from drow/dcol
-                cheat_duration = abs(drow) + abs(dcol)
-
-                # Skip if no movement or exceeds max duration
-                if cheat_duration == 0 or cheat_duration > max_cheat_duration:
-                    continue
-
-                cheat_end = Coord.from_rc(current_coord.row + drow, current_coord.col + dcol)
-
-                # Check if cheat end is on the path
-                if cheat_end in path_index_by_coord:
-                    end_index = path_index_by_coord[cheat_end]
-
-                    # Calculate time saved: path distance - cheat duration
-                    path_distance = end_index - current_index
-                    time_saved = path_distance - cheat_duration
-
-                    # Only count if we actually save time (and move forward)
-                    if time_saved > 0:
-                        savings_count[time_saved] = savings_count.get(time_saved, 0) + 1
+    for current_index, here in enumerate(cells):
+        for offset, cheat_duration in cheats:
+            # Off-path ends hold -1, so they can never save time
+            time_saved = positions[here + offset] - current_index - cheat_duration
+
+            # Only count if we actually save time (and move forward)
+            if time_saved > 0:
+                savings_count[time_saved] = savings_count.get(time_saved, 0) + 1
 
     return savings_count
 
@@ -1,6 +1,15 @@
 from aoc import Input, run, TestCase, Coord
 from itertools import product
 from collections import deque
+from functools import cache
+import hashlib
+from pathlib import Path
+from memo import BoundedMemo
+import parse_cache
+
+KEYPAD_CACHE_DIR = parse_cache.CACHE_DIR / "keypads"
+# bump when the stored table format changes
+KEYPAD_CACHE_VERSION = 1
 
 
 def find_all_shortest_paths(matrix, start, end):
@@ -124,8 +133,43 @@ def shortest_path(pad, pad_coords, start, end):
 #
 
 
-NUMBER_PAD = {p: shortest_path(num_pad, num_coords, *p) for p in product(nums, nums)}
-DIRECTION_PAD = {p: shortest_path(dir_pad, dir_coords, *p) for p in product(dirs, dirs)}
+def build_pad_table(pad, pad_coords, keys):
+    """All shortest button sequences between every ordered pair of keys."""
+    return {p: shortest_path(pad, pad_coords, *p) for p in product(keys, keys)}
+
+
+def load_pad_table(pad, pad_coords, keys):
+    """
+    build_pad_table, persisted on disk per keypad layout.
+
+    Uses the opt-in parse cache (AOC_PARSE_CACHE=1). The key covers the layout,
+    a format version and the source of this whole file, so editing the path
+    finders, their helpers or constants such as the direction characters
+    rebuilds the table.
+    """
+    if not parse_cache.enabled():
+        return build_pad_table(pad, pad_coords, keys)
+
+    digest = hashlib.sha256(f"{KEYPAD_CACHE_VERSION}\0{pad!r}\0".encode())
+    digest.update(Path(__file__).read_bytes())
+    key = digest.hexdigest()
+    try:
+        return parse_cache.load(key, KEYPAD_CACHE_DIR)
+    except KeyError:
+        table = build_pad_table(pad, pad_coords, keys)
+        parse_cache.store(key, table, KEYPAD_CACHE_DIR)
+        return table
+
+
+# Built on first use rather than at import, so importing the module is cheap
+@cache
+def number_pad():
+    return load_pad_table(num_pad, num_coords, nums)
+
+
+@cache
+def direction_pad():
+    return load_pad_table(dir_pad, dir_coords, dirs)
 
 
 def generate_combinations(list_of_lists):
@@ -188,14 +232,14 @@ def find_min_length(from_button, to_button, depth, memo):
     # The cost is just the number of moves in the path
     if depth == 0:
         # Direct path on direction pad
-        paths = DIRECTION_PAD[(from_button, to_button)]
+        paths = direction_pad()[(from_button, to_button)]
         result = min(len(path) for path in paths)
         memo[key] = result
         return result
 
     # Recursive case: need to control a robot at depth-1
     # Get all possible paths on the direction pad
-    paths = DIRECTION_PAD[(from_button, to_button)]
+    paths = direction_pad()[(from_button, to_button)]
 
     min_total = float('inf')
 
@@ -227,7 +271,8 @@ def solve(data_file, num_directional_robots):
         num_directional_robots: Number of directional keypads (2 for part1, 25 for part2)
     """
     result = []
-    memo = {}
+    memo = BoundedMemo("21 find_min_length", maxsize=4096)
+    pad = number_pad()
 
     for button_seq in Input(data_file).as_lines():
         # Calculate the minimum length needed to type this sequence
@@ -236,7 +281,7 @@ def solve(data_file, num_directional_robots):
 
         for target_button in button_seq:
             # Get the paths on the numeric keypad for this transition
-            paths = NUMBER_PAD[(current_button, target_button)]
+            paths = pad[(current_button, target_button)]
 
             min_path_length = float('inf')
             for path in paths:
@@ -1,4 +1,5 @@
-from aoc import Input, run, TestCase
+from aoc import run, TestCase
+from streaming import StreamingInput
 from collections import defaultdict
 
 
@@ -46,7 +47,8 @@ def generate_nth_secret(initial, n):
 
 def sum_final_secrets(data_file):
     """Sum the final evolved secret numbers for all buyers."""
-    initial_secrets = [int(line) for line in Input(data_file).as_lines()]
+    with StreamingInput(data_file) as data:
+        initial_secrets = [int(line) for line in data.as_lines()]
 
     return sum(generate_nth_secret(secret, ITERATIONS) for secret in initial_secrets)
 
@@ -89,7 +91,8 @@ def maximize_banana_profit(data_file):
     Each buyer sells once at the first occurrence of the chosen sequence.
     We need to find which sequence yields the maximum total across all buyers.
     """
-    initial_secrets = [int(line) for line in Input(data_file).as_lines()]
+    with StreamingInput(data_file) as data:
+        initial_secrets = [int(line) for line in data.as_lines()]
     sequence_totals = defaultdict(int)
 
     for secret in initial_secrets:
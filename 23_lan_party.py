@@ -1,4 +1,5 @@
-from aoc import Input, find_max_clique, run, TestCase
+from aoc import Input, run, TestCase
+from parse_cache import cached_parse
 
 # frozenset - immutable set that is hashable, used to avoid duplicates
 
@@ -6,6 +7,11 @@ CHIEFS_COMPUTER_PREFIX = "t"
 NETWORK_SIZE = 3
 
 
+@cached_parse
+def parse(data_file):
+    return Input(data_file).as_adjacency_list()
+
+
 def find_all_networks(graph):
     """
     Find all sets of three interconnected computers (triangles in graph).
@@ -29,18 +35,119 @@ def contains_chiefs_computer(network):
 
 
 def count_chiefs_networks(data_file):
-    graph = Input(data_file).as_adjacency_list()
+    graph = parse(data_file)
     networks = find_all_networks(graph)
     count = sum(contains_chiefs_computer(network) for network in networks)
     return count
 
 
+def degeneracy_order(neighbors):
+    """
+    Vertices in degeneracy order: repeatedly take one of the smallest degree
+    among those left. Every vertex then has few neighbours after it.
+    """
+    degree = [len(n) for n in neighbors]
+    buckets = [set() for _ in range(max(degree, default=0) + 1)]
+    for vertex, d in enumerate(degree):
+        buckets[d].add(vertex)
+
+    removed = bytearray(len(neighbors))
+    order = []
+    smallest = 0
+    for _ in range(len(neighbors)):
+        while not buckets[smallest]:
+            smallest += 1
+        vertex = buckets[smallest].pop()
+        order.append(vertex)
+        removed[vertex] = 1
+        for neighbor in neighbors[vertex]:
+            if not removed[neighbor]:
+                buckets[degree[neighbor]].remove(neighbor)
+                degree[neighbor] -= 1
+                buckets[degree[neighbor]].add(neighbor)
+        # removing a vertex lowers its neighbours' degrees by at most one
+        smallest = max(smallest - 1, 0)
+    return order
+
+
+def find_max_clique(graph):
+    """
+    Largest clique of an adjacency dict, as a set of its nodes.
+
+    Nodes are relabelled to integers and taken in degeneracy order. Each one
+    seeds a Bron-Kerbosch search with pivoting over just its neighbourhood,
+    relabelled again so the adjacency bitsets are only as wide as its degree;
+    neighbours earlier in the order are already covered and start excluded.
+    Branches that cannot beat the best clique so far are pruned.
+    """
+    nodes = sorted(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    neighbors = [[index[n] for n in graph[node]] for node in nodes]
+    order = degeneracy_order(neighbors)
+    rank = [0] * len(nodes)
+    for position, vertex in enumerate(order):
+        rank[vertex] = position
+
+    best, best_size = [], 0
+
+    def expand(adjacency, clique, size, candidates, excluded):
+        nonlocal best, best_size
+        if not candidates:
+            if not excluded and size > best_size:
+                best, best_size = clique, size
+            return
+        if size + candidates.bit_count() <= best_size:
+            return
+
+        # pivot on the vertex covering most candidates, skip its neighbours
+        pool = candidates | excluded
+        pivot_neighbors = 0
+        pivot_count = -1
+        while pool:
+            low = pool & -pool
+            pool ^= low
+            covered = candidates & adjacency[low.bit_length() - 1]
+            if covered.bit_count() > pivot_count:
+                pivot_neighbors, pivot_count = covered, covered.bit_count()
+
+        branches = candidates & ~pivot_neighbors
+        while branches:
+            low = branches & -branches
+            branches ^= low
+            vertex_adjacency = adjacency[low.bit_length() - 1]
+            expand(
+                adjacency,
+                clique | low,
+                size + 1,
+                candidates & vertex_adjacency,
+                excluded & vertex_adjacency,
+            )
+            candidates ^= low
+            excluded |= low
+
+    for vertex in order:
+        local = neighbors[vertex]
+        later = sum(1 << i for i, n in enumerate(local) if rank[n] > rank[vertex])
+        if 1 + later.bit_count() <= best_size:
+            continue
+        position = {n: i for i, n in enumerate(local)}
+        adjacency = [
+            sum(1 << position[m] for m in neighbors[n] if m in position) for n in local
+        ]
+        found = best_size
+        expand(adjacency, 0, 1, later, ((1 << len(local)) - 1) & ~later)
+        if best_size > found:
+            best = [vertex] + [n for i, n in enumerate(local) if best >> i & 1]
+
+    return {nodes[i] for i in best}
+
+
 def find_largest_clique(data_file):
     """
     Find the largest fully-connected group of computers and return the password.
     Returns computers sorted alphabetically, joined with commas.
     """
-    graph = Input(data_file).as_adjacency_list()
+    graph = parse(data_file)
     largest_clique = find_max_clique(graph)
     password = ",".join(sorted(largest_clique))
     return password
@@ -0,0 +1,133 @@
+"""
+Run one day's solver over many inputs in parallel.
+
+    python3 batch.py DAY PART INPUTS [--arg VALUE ...] [--output FILE]
+                     [--format csv|jsonl] [--workers N] [--chunksize N]
+
+INPUTS is a directory (every file in it) or a glob pattern. PART is a
+function name such as ``parts`` or a 1-based index (see suites.resolve_part).
+Inputs are spread over a process pool in chunks and one
+``(input, answer, seconds)`` row is written per input as soon as it finishes,
+so the output is in completion order. Failures are reported in an ``error``
+column rather than stopping the batch.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+from suites import find_days, parse_arg, resolve_part
+
+FIELDS = ["input", "answer", "seconds", "error"]
+
+_solver = None
+
+
+def init_worker(name, part, args):
+    global _solver
+    func = resolve_part(name, part)
+    _solver = (func, args)
+
+
+def solve(path):
+    func, args = _solver
+    start = time.perf_counter()
+    try:
+        answer, error = repr(func(path, *args)), ""
+    except Exception as e:
+        answer, error = "", f"{type(e).__name__}: {e}"
+    return {
+        "input": path,
+        "answer": answer,
+        "seconds": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def find_inputs(pattern):
+    """Files in a directory, or the files matching a glob, sorted."""
+    if Path(pattern).is_dir():
+        return sorted(str(p) for p in Path(pattern).iterdir() if p.is_file())
+    return sorted(p for p in glob.glob(pattern) if Path(p).is_file())
+
+
+def default_chunksize(count, workers):
+    # a few chunks per worker balances uneven inputs against IPC overhead
+    return max(1, count // (workers * 4))
+
+
+def run_batch(name, part, args, inputs, workers, chunksize=None):
+    """Yield one result row per input as the pool finishes them."""
+    chunksize = chunksize or default_chunksize(len(inputs), workers)
+    with Pool(workers, initializer=init_worker, initargs=(name, part, args)) as pool:
+        yield from pool.imap_unordered(solve, inputs, chunksize=chunksize)
+
+
+class RowWriter:
+    def __init__(self, stream, fmt):
+        self.stream = stream
+        self.csv = csv.DictWriter(stream, FIELDS) if fmt == "csv" else None
+        if self.csv:
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.csv:
+            self.csv.writerow(dict(row, seconds=f"{row['seconds']:.6f}"))
+        else:
+            self.stream.write(json.dumps(row) + "\n")
+        # flushed per row so the output can be tailed while the batch runs
+        self.stream.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run one solver over many inputs.")
+    parser.add_argument("day")
+    parser.add_argument("part", help="function name or 1-based index")
+    parser.add_argument("inputs", help="directory or glob of input files")
+    parser.add_argument(
+        "--arg", action="append", default=[], help="extra argument, repeatable"
+    )
+    parser.add_argument("--output", help="file to write, default stdout")
+    parser.add_argument("--format", choices=["csv", "jsonl"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int)
+    args = parser.parse_args(argv)
+
+    (name,) = find_days([args.day]) or [None]
+    if name is None:
+        parser.error(f"no day {args.day}")
+    inputs = find_inputs(args.inputs)
+    if not inputs:
+        parser.error(f"no input files match {args.inputs}")
+
+    fmt = args.format or ("jsonl" if (args.output or "").endswith(".jsonl") else "csv")
+    extra = [parse_arg(value) for value in args.arg]
+
+    stream = open(args.output, "w", newline="") if args.output else sys.stdout
+    start = time.perf_counter()
+    failures = 0
+    try:
+        writer = RowWriter(stream, fmt)
+        rows = run_batch(name, args.part, extra, inputs, args.workers, args.chunksize)
+        for row in rows:
+            writer.write(row)
+            failures += bool(row["error"])
+    finally:
+        if args.output:
+            stream.close()
+
+    print(
+        f"{len(inputs)} inputs in {time.perf_counter() - start:.3f}s,"
+        f" {failures} failed",
+        file=sys.stderr,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
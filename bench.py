@@ -0,0 +1,255 @@
+"""
+Benchmark the TestCase suites of the day solvers.
+
+    python3 bench.py [day ...] [--repeat N] [--warmup N] [--output FILE]
+                     [--search-stats]
+    python3 bench.py [day ...] --profile cpu|mem
+
+Each case is run ``warmup`` times untimed and then ``repeat`` times, recording
+wall time (perf_counter) and CPU time (process_time plus reaped children, so
+days that fan out to a Pool such as 06 are charged for their workers).
+Defaults can also come from AOC_BENCH_REPEAT, AOC_BENCH_WARMUP and
+AOC_BENCH_OUTPUT. Results are printed per day/part/input and written as JSON.
+--search-stats (or AOC_SEARCH_STATS=1) adds the work counters of the CSR graph
+searches; counting slows the searches, so compare times only between runs
+with the same setting.
+
+With --profile each case runs once under cProfile (cpu) or tracemalloc (mem)
+instead, writing profiles/<day>.<part>.<input>.prof or .txt. cProfile only
+sees the calling thread of the parent process, so work done in Pool workers
+shows up as time spent waiting in Pool.map.
+"""
+import argparse
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from csr import (
+    enable_search_stats,
+    format_search_stats,
+    reset_search_stats,
+    search_stats,
+)
+from memo import format_memo_stats, memo_stats, reset_memo_stats
+from suites import call, find_days, load_suites
+
+DEFAULT_REPEAT = 5
+DEFAULT_WARMUP = 1
+DEFAULT_OUTPUT = "bench_results.json"
+PROFILE_DIR = Path("profiles")
+PROFILE_TOP = 15
+
+
+def cpu_seconds():
+    children = os.times()
+    return time.process_time() + children.children_user + children.children_system
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a non-empty list."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def summarize(values):
+    return {
+        "min": min(values),
+        "median": percentile(values, 50),
+        "p95": percentile(values, 95),
+    }
+
+
+def format_seconds(seconds):
+    if seconds < 1:
+        return f"{seconds * 1000:8.2f}ms"
+    return f"{seconds:8.3f}s "
+
+
+def time_case(func, case, repeat, warmup):
+    """
+    Time one case.
+
+    Returns:
+        Tuple of (answer, wall_times, cpu_times)
+    """
+    for _ in range(warmup):
+        call(func, case)
+
+    answer = None
+    wall_times, cpu_times = [], []
+    for _ in range(repeat):
+        wall, cpu = time.perf_counter(), cpu_seconds()
+        answer = call(func, case)
+        cpu_times.append(cpu_seconds() - cpu)
+        wall_times.append(time.perf_counter() - wall)
+
+    return answer, wall_times, cpu_times
+
+
+def measure(suite, case, repeat, warmup):
+    """Time one case and return its result record, as written to the JSON."""
+    reset_memo_stats()
+    reset_search_stats()
+    answer, wall_times, cpu_times = time_case(suite.func, case, repeat, warmup)
+    return {
+        "day": suite.day,
+        "part": suite.part,
+        "input": case.label,
+        "correct": answer == case.expected,
+        "runs": repeat,
+        "wall": summarize(wall_times),
+        "cpu": summarize(cpu_times),
+        # summed over warmup and timed runs
+        "memo": memo_stats(),
+        "search": search_stats(),
+    }
+
+
+def benchmark(days, repeat, warmup, report=print):
+    results = []
+    for name in days:
+        for suite in load_suites(name):
+            for case in suite.cases:
+                if not case.available:
+                    report(
+                        f"{name:28} {suite.part:24} {case.label:24} skipped (no input)"
+                    )
+                    continue
+
+                result = measure(suite, case, repeat, warmup)
+                results.append(result)
+                report(format_result(result))
+                lines = format_memo_stats(result["memo"])
+                lines += format_search_stats(result["search"])
+                for line in lines:
+                    report(f"    {line}")
+    return results
+
+
+def format_result(result):
+    wall, cpu = result["wall"], result["cpu"]
+    status = "" if result["correct"] else "  WRONG ANSWER"
+    return (
+        f"{result['day']:28} {result['part']:24} {result['input']:24}"
+        f" min {format_seconds(wall['min'])}"
+        f" med {format_seconds(wall['median'])}"
+        f" p95 {format_seconds(wall['p95'])}"
+        f" cpu {format_seconds(cpu['median'])}{status}"
+    )
+
+
+def profile_cpu(func, case, stem):
+    """Run a case under cProfile, dump the stats and return a short summary."""
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(call, func, case)
+    path = PROFILE_DIR / f"{stem}.prof"
+    profiler.dump_stats(path)
+
+    summary = io.StringIO()
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats("cumulative").print_stats(PROFILE_TOP)
+    return answer, path, summary.getvalue()
+
+
+def profile_mem(func, case, stem):
+    """Run a case under tracemalloc and record the peak and top allocations."""
+    tracemalloc.start(10)
+    try:
+        answer = call(func, case)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    lines = [f"peak {peak / 1024 / 1024:.2f} MiB", "top allocations still held:"]
+    for statistic in snapshot.statistics("lineno")[:PROFILE_TOP]:
+        lines.append(f"  {statistic}")
+    summary = "\n".join(lines) + "\n"
+
+    path = PROFILE_DIR / f"{stem}.txt"
+    path.write_text(summary)
+    return answer, path, summary
+
+
+PROFILERS = {"cpu": profile_cpu, "mem": profile_mem}
+
+
+def profile(days, mode, report=print):
+    PROFILE_DIR.mkdir(exist_ok=True)
+    for name in days:
+        for suite in load_suites(name):
+            for case in suite.cases:
+                if not case.available:
+                    continue
+
+                stem = f"{name}.{suite.part}.{case.label}"
+                answer, path, summary = PROFILERS[mode](suite.func, case, stem)
+                status = "" if answer == case.expected else "  WRONG ANSWER"
+                report(f"{name:28} {suite.part:24} {case.label:24} -> {path}{status}")
+                report(summary)
+
+
+def write_results(path, results, repeat, warmup):
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the day solvers.")
+    parser.add_argument("days", nargs="*", help="day numbers, default all")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=int(os.environ.get("AOC_BENCH_REPEAT", DEFAULT_REPEAT)),
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=int(os.environ.get("AOC_BENCH_WARMUP", DEFAULT_WARMUP)),
+    )
+    parser.add_argument(
+        "--output", default=os.environ.get("AOC_BENCH_OUTPUT", DEFAULT_OUTPUT)
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILERS))
+    parser.add_argument(
+        "--search-stats", action="store_true", help="count graph search work"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.search_stats:
+        enable_search_stats()
+    if args.profile:
+        profile(find_days(args.days), args.profile)
+        return 0
+
+    results = benchmark(find_days(args.days), args.repeat, args.warmup)
+    write_results(args.output, results, args.repeat, args.warmup)
+    print(f"\nwrote {len(results)} results to {args.output}")
+    return 0 if all(result["correct"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
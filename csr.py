@@ -0,0 +1,499 @@
+"""
+Compile grid mazes into CSR adjacency arrays, and search over them.
+
+``aoc.bfs``/``aoc.dijkstra`` call a Python ``neighbors_func`` closure every
+time a node is expanded, re-checking bounds and walls each time. Compiling
+the maze once into compressed sparse rows (an offsets array indexing into
+parallel target/weight arrays) means repeated searches over the same maze
+only walk integer arrays.
+
+Nodes are packed FlatGrid cells (``row * width + col``). With
+``compile_heading_grid`` they are ``cell * 4 + heading`` states, where the
+heading indexes ``Coord.DIRECTIONS_CARDINAL``. Distances come back as an
+``array('q')`` indexed by node, holding UNREACHED for nodes not reached.
+
+With AOC_SEARCH_STATS=1 (or ``enable_search_stats()``) every search adds its
+work to per-search counters: nodes popped, edges relaxed (distance
+improvements, each queueing a node), peak frontier size and seconds spent,
+plus the seconds spent compiling graphs, the CSR counterpart of time in a
+``neighbors_func``. ``search_stats`` returns them and the harness prints them
+per case. Searches call their queue operations through local names, which
+are only swapped for counting wrappers when stats are on, so the disabled
+path runs exactly the uninstrumented loop.
+"""
+import heapq
+import os
+import time
+from array import array
+from collections import deque
+from dataclasses import asdict, dataclass
+from itertools import accumulate
+
+from aoc import Coord
+
+UNREACHED = -1
+_stats_enabled = bool(os.environ.get("AOC_SEARCH_STATS"))
+_STATS = {}
+
+
+@dataclass
+class SearchStats:
+    calls: int = 0
+    nodes_popped: int = 0
+    edges_relaxed: int = 0
+    peak_frontier: int = 0
+    seconds: float = 0.0
+
+
+def enable_search_stats(enabled=True):
+    global _stats_enabled
+    _stats_enabled = enabled
+
+
+def search_stats():
+    """Snapshot of the counters of every search run since the last reset."""
+    return {name: asdict(stats) for name, stats in _STATS.items()}
+
+
+def reset_search_stats():
+    _STATS.clear()
+
+
+def format_search_stats(stats):
+    """One line per kind of search (or graph compilation) that ran."""
+    lines = []
+    for name, s in stats.items():
+        work = (
+            f" {s['nodes_popped']} popped {s['edges_relaxed']} relaxed,"
+            f" peak frontier {s['peak_frontier']},"
+            if s["nodes_popped"]
+            else ","
+        )
+        lines.append(f"search {name}: {s['calls']} calls{work} {s['seconds']:.3f}s")
+    return lines
+
+
+class _Work:
+    """Counting wrappers for one search's queue operations."""
+
+    def __init__(self, name, queued=1):
+        self.name = name
+        self.started = time.perf_counter()
+        self.popped = self.relaxed = 0
+        self.queued = self.peak = queued
+
+    def push(self, push):
+        def counted(*args):
+            self.relaxed += 1
+            self.queued += 1
+            self.peak = max(self.peak, self.queued)
+            return push(*args)
+
+        return counted
+
+    def pop(self, pop):
+        def counted(*args):
+            self.popped += 1
+            self.queued -= 1
+            return pop(*args)
+
+        return counted
+
+    def record(self):
+        stats = _STATS.setdefault(self.name, SearchStats())
+        stats.calls += 1
+        stats.nodes_popped += self.popped
+        stats.edges_relaxed += self.relaxed
+        stats.peak_frontier = max(stats.peak_frontier, self.peak)
+        stats.seconds += time.perf_counter() - self.started
+
+
+# largest edge weight for which dijkstra(queue="auto") expects enough distance
+# ties to make a bucket queue pay off
+BUCKET_MAX_WEIGHT = 1024
+
+
+@dataclass
+class CSRGraph:
+    offsets: array
+    targets: array
+    weights: array
+
+    @property
+    def node_count(self):
+        return len(self.offsets) - 1
+
+    def neighbors(self, node):
+        """List of (target, weight) pairs of a node."""
+        start, stop = self.offsets[node], self.offsets[node + 1]
+        return list(zip(self.targets[start:stop], self.weights[start:stop]))
+
+    def reversed(self):
+        """Graph with every edge flipped, for walking back from targets."""
+        sources = array("i")
+        for node in range(self.node_count):
+            sources.extend([node] * (self.offsets[node + 1] - self.offsets[node]))
+        # a stable sort by target keeps each node's reversed edges in source order
+        order = sorted(range(len(self.targets)), key=self.targets.__getitem__)
+
+        counts = [0] * (self.node_count + 1)
+        for target in self.targets:
+            counts[target + 1] += 1
+        offsets = array("i", accumulate(counts))
+
+        targets = array("i", [sources[edge] for edge in order])
+        weights = array("i", [self.weights[edge] for edge in order])
+        return CSRGraph(offsets, targets, weights)
+
+
+def _open_cells(grid, passable):
+    return bytearray(grid[index] in passable for index in range(len(grid.cells)))
+
+
+def compile_grid(grid, passable, directions=Coord.DIRECTIONS_CARDINAL):
+    """
+    Compile a FlatGrid into a CSR graph over its packed cells.
+
+    Args:
+        grid: FlatGrid to compile
+        passable: Collection of cell values that can be entered
+        directions: Moves between cells, each with weight 1
+
+    Returns:
+        CSRGraph with one node per cell; walls get no edges
+    """
+    work = _Work("compile_grid") if _stats_enabled else None
+    open_cells = _open_cells(grid, passable)
+    table = grid.neighbor_table(directions)
+    degree = len(directions)
+
+    offsets, targets = array("i", [0]), array("i")
+    for cell, is_open in enumerate(open_cells):
+        if is_open:
+            base = cell * degree
+            targets.extend(
+                n for n in table[base : base + degree] if n >= 0 and open_cells[n]
+            )
+        offsets.append(len(targets))
+
+    if work:
+        work.record()
+    return CSRGraph(offsets, targets, array("i", [1]) * len(targets))
+
+
+def compile_heading_grid(grid, passable, move_cost, turn_cost):
+    """
+    Compile a FlatGrid into a CSR graph over (cell, heading) states.
+
+    State ``cell * 4 + heading`` can move one cell forward for move_cost when
+    that cell is passable, or turn 90 degrees either way for turn_cost.
+    """
+    work = _Work("compile_heading_grid") if _stats_enabled else None
+    directions = Coord.DIRECTIONS_CARDINAL
+    open_cells = _open_cells(grid, passable)
+    table = grid.neighbor_table(directions)
+
+    offsets, targets, weights = array("i", [0]), array("i"), array("i")
+    for cell, is_open in enumerate(open_cells):
+        for heading in range(4):
+            if is_open:
+                ahead = table[cell * 4 + heading]
+                if ahead >= 0 and open_cells[ahead]:
+                    targets.append(ahead * 4 + heading)
+                    weights.append(move_cost)
+                for turn in (-1, 1):
+                    targets.append(cell * 4 + (heading + turn) % 4)
+                    weights.append(turn_cost)
+            offsets.append(len(targets))
+
+    if work:
+        work.record()
+    return CSRGraph(offsets, targets, weights)
+
+
+def bfs(graph, start, blocked=None, target=None):
+    """
+    Unweighted distances from start.
+
+    Args:
+        graph: CSRGraph to search
+        start: Start node
+        blocked: Optional bytearray of nodes that may not be entered; a
+            blocked start reaches nothing, not even itself
+        target: Optional node to stop at as soon as its distance is known
+
+    Returns:
+        array of distances by node, UNREACHED where not reachable (or, with a
+        target, not reached before the search stopped)
+    """
+    offsets, targets = graph.offsets, graph.targets
+    distances = array("q", [UNREACHED]) * graph.node_count
+    if blocked and blocked[start]:
+        return distances
+    distances[start] = 0
+    if start == target:
+        return distances
+    queue = deque([start])
+    push, pop = queue.append, queue.popleft
+    work = None
+    if _stats_enabled:
+        work = _Work("bfs")
+        push, pop = work.push(push), work.pop(pop)
+    try:
+        while queue:
+            node = pop()
+            next_distance = distances[node] + 1
+            for neighbor in targets[offsets[node] : offsets[node + 1]]:
+                if distances[neighbor] == UNREACHED and not (
+                    blocked and blocked[neighbor]
+                ):
+                    distances[neighbor] = next_distance
+                    if neighbor == target:
+                        return distances
+                    push(neighbor)
+        return distances
+    finally:
+        if work:
+            work.record()
+
+
+def dijkstra(graph, start, queue="auto", target=None):
+    """
+    Weighted distances from start, UNREACHED where not reachable.
+
+    Args:
+        graph: CSRGraph to search
+        start: Start node
+        queue: "heap" for a binary heap of nodes, "bucket" for a bucket queue
+            that settles all nodes at one distance together (a sparse form of
+            Dial's algorithm, fastest when small integer weights cause many
+            distance ties), or "auto" to use buckets when the largest weight
+            is at most BUCKET_MAX_WEIGHT
+        target: Optional node to stop at once its distance is final
+
+    Returns:
+        array of distances by node; the same whichever queue is used. With a
+        target only the target's distance is guaranteed final
+    """
+    if queue == "auto":
+        small = not graph.weights or max(graph.weights) <= BUCKET_MAX_WEIGHT
+        queue = "bucket" if small else "heap"
+    if queue == "bucket":
+        return _dijkstra_buckets(graph, start, target)
+    if queue != "heap":
+        raise ValueError(f"unknown queue {queue!r}")
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = array("q", [UNREACHED]) * graph.node_count
+    distances[start] = 0
+    heap = [(0, start)]
+    push, pop = heapq.heappush, heapq.heappop
+    work = None
+    if _stats_enabled:
+        work = _Work("dijkstra heap")
+        push, pop = work.push(push), work.pop(pop)
+    try:
+        while heap:
+            distance, node = pop(heap)
+            if distance > distances[node]:
+                continue
+            if node == target:
+                break
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor, candidate = targets[edge], distance + weights[edge]
+                if distances[neighbor] == UNREACHED or candidate < distances[neighbor]:
+                    distances[neighbor] = candidate
+                    push(heap, (candidate, neighbor))
+        return distances
+    finally:
+        if work:
+            work.record()
+
+
+def _dijkstra_buckets(graph, start, target):
+    # Nodes are queued in one bucket per tentative distance and settled a
+    # whole bucket at a time. Only distinct distances go through the heap, and
+    # with weights such as 1 and 1000 most pushes land in an existing bucket.
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = array("q", [UNREACHED]) * graph.node_count
+    distances[start] = 0
+    buckets = {0: [start]}
+    order = [0]
+    take = buckets.pop
+    work = None
+    if _stats_enabled:
+        work = _Work("dijkstra bucket")
+        take = _counted_take(work, buckets)
+    try:
+        while order:
+            distance = heapq.heappop(order)
+            for node in take(distance):
+                if distances[node] != distance:
+                    # stale entry, settled earlier at a smaller distance
+                    continue
+                if node == target:
+                    return distances
+                for edge in range(offsets[node], offsets[node + 1]):
+                    neighbor, candidate = targets[edge], distance + weights[edge]
+                    if (
+                        distances[neighbor] == UNREACHED
+                        or candidate < distances[neighbor]
+                    ):
+                        distances[neighbor] = candidate
+                        bucket = buckets.get(candidate)
+                        if bucket is None:
+                            buckets[candidate] = [neighbor]
+                            heapq.heappush(order, candidate)
+                        else:
+                            bucket.append(neighbor)
+        return distances
+    finally:
+        if work:
+            # entries still queued at an early exit were relaxed but not popped
+            work.relaxed = work.popped + sum(map(len, buckets.values())) - 1
+            work.record()
+
+
+def _counted_take(work, buckets):
+    # bucket appends are plain list appends, so the queue is measured a whole
+    # bucket at a time: taking one pops all its entries
+    def take(distance):
+        work.peak = max(work.peak, sum(map(len, buckets.values())))
+        bucket = buckets.pop(distance)
+        work.popped += len(bucket)
+        return bucket
+
+    return take
+
+
+def manhattan(grid, target):
+    """Admissible A* heuristic over the packed cells of grid, towards target."""
+    width = grid.width
+    target_row, target_col = divmod(target, width)
+
+    def heuristic(node):
+        row, col = divmod(node, width)
+        return abs(row - target_row) + abs(col - target_col)
+
+    return heuristic
+
+
+def astar(graph, start, target, heuristic, blocked=None):
+    """
+    Distance from start to target, UNREACHED if there is no path.
+
+    Args:
+        graph: CSRGraph to search
+        start: Start node
+        target: Node to reach
+        heuristic: Function of a node, never overestimating its distance to
+            target and consistent along edges, e.g. ``manhattan(grid, target)``
+        blocked: Optional bytearray of nodes that may not be entered; there
+            is no path when start or target is blocked
+    """
+    if blocked and (blocked[start] or blocked[target]):
+        return UNREACHED
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    # point-to-point searches touch few nodes, so a dict beats a full array
+    distances = {start: 0}
+    heap = [(heuristic(start), 0, start)]
+    push, pop = heapq.heappush, heapq.heappop
+    work = None
+    if _stats_enabled:
+        work = _Work("astar")
+        push, pop = work.push(push), work.pop(pop)
+    try:
+        while heap:
+            _, distance, node = pop(heap)
+            if node == target:
+                return distance
+            if distance > distances[node]:
+                continue
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor, candidate = targets[edge], distance + weights[edge]
+                if blocked and blocked[neighbor]:
+                    continue
+                if candidate < distances.get(neighbor, candidate + 1):
+                    distances[neighbor] = candidate
+                    push(heap, (candidate + heuristic(neighbor), candidate, neighbor))
+        return UNREACHED
+    finally:
+        if work:
+            work.record()
+
+
+def bidirectional_bfs(graph, start, target, blocked=None, reverse=None):
+    """
+    Unweighted distance from start to target, UNREACHED if there is no path.
+
+    Searches forward from start and backward from target, always growing the
+    smaller frontier by one whole level, and stops once the two meet.
+
+    Args:
+        graph: CSRGraph to search
+        start: Start node
+        target: Node to reach
+        blocked: Optional bytearray of nodes that may not be entered; there
+            is no path when start or target is blocked
+        reverse: Reversed graph for the backward search; defaults to graph
+            itself, which is right for the symmetric graphs of compile_grid
+    """
+    if blocked and (blocked[start] or blocked[target]):
+        return UNREACHED
+    if start == target:
+        return 0
+    reverse = graph if reverse is None else reverse
+    sides = [(graph, {start: 0}, [start]), (reverse, {target: 0}, [target])]
+    work = _Work("bidirectional_bfs", queued=2) if _stats_enabled else None
+    try:
+        best = None
+        while best is None and sides[0][2] and sides[1][2]:
+            # expand the side with the smaller frontier
+            if len(sides[1][2]) < len(sides[0][2]):
+                sides.reverse()
+            (side_graph, seen, frontier), (_, other_seen, other_frontier) = sides
+            offsets, targets = side_graph.offsets, side_graph.targets
+            next_frontier = []
+            for node in frontier:
+                next_distance = seen[node] + 1
+                for neighbor in targets[offsets[node] : offsets[node + 1]]:
+                    if neighbor in seen or (blocked and blocked[neighbor]):
+                        continue
+                    if neighbor in other_seen:
+                        total = next_distance + other_seen[neighbor]
+                        best = total if best is None else min(best, total)
+                    seen[neighbor] = next_distance
+                    next_frontier.append(neighbor)
+            if work:
+                work.popped += len(frontier)
+                work.relaxed += len(next_frontier)
+                work.peak = max(work.peak, len(next_frontier) + len(other_frontier))
+            sides[0] = (side_graph, seen, next_frontier)
+        return UNREACHED if best is None else best
+    finally:
+        if work:
+            work.record()
+
+
+def shortest_path_nodes(graph, distances, ends):
+    """
+    Every node lying on some shortest path from the search start to one of ends.
+
+    Walks the reversed graph from ends, following only edges that are tight
+    (distance of the source plus edge weight equals distance of the target).
+    """
+    reverse = graph.reversed()
+    on_path = set(ends)
+    stack = list(ends)
+    while stack:
+        node = stack.pop()
+        for edge in range(reverse.offsets[node], reverse.offsets[node + 1]):
+            source = reverse.targets[edge]
+            if (
+                source not in on_path
+                and distances[source] != UNREACHED
+                and distances[source] + reverse.weights[edge] == distances[node]
+            ):
+                on_path.add(source)
+                stack.append(source)
+    return on_path
@@ -0,0 +1,153 @@
+"""
+Compact array-backed grid with the ``aoc.Grid`` API.
+
+Cells are stored row-major in one flat buffer: a bytearray for character
+and boolean grids and an ``array('i')`` for integer grids. There is no Python
+object per cell. Lookups by ``Coord`` work as they do with ``aoc.Grid``.
+Out-of-bounds keys raise IndexError rather than wrapping around the buffer
+to another cell; test ``key in grid`` first.
+
+Hot loops can skip Coord objects and use packed ints (``row * width + col``).
+``index``/``coord`` convert between the two, grid lookups accept either, and
+``neighbor_table`` gives precomputed in-bounds neighbours of every packed
+cell. Integer nodes also work directly with the node-generic ``aoc.bfs`` and
+``aoc.dijkstra``.
+"""
+from array import array
+from functools import lru_cache
+
+from aoc import Coord, Dimension
+
+
+class FlatGrid:
+    def __init__(self, size, cells, is_text=False, is_bool=False):
+        self.size = size
+        self.width = size.width
+        self.cells = cells
+        # text grids store ord(char) and hand back one-character strings,
+        # boolean grids store 0/1 and hand back bools
+        self.is_text = is_text
+        self.is_bool = is_bool
+
+    @classmethod
+    def from_lines(cls, lines):
+        """Character grid from equal-length lines."""
+        lines = list(lines)
+        size = Dimension(len(lines), len(lines[0]) if lines else 0)
+        return cls(size, bytearray("".join(lines), "ascii"), is_text=True)
+
+    @classmethod
+    def from_int_lines(cls, lines, empty_value=-1):
+        """Single-digit integer grid; non-digits become empty_value."""
+        lines = list(lines)
+        size = Dimension(len(lines), len(lines[0]) if lines else 0)
+        cells = array(
+            "i",
+            (int(ch) if ch.isdigit() else empty_value for line in lines for ch in line),
+        )
+        return cls(size, cells)
+
+    @classmethod
+    def create(cls, size, value):
+        """Grid of the given size filled with value (str, bool or int)."""
+        count = size.height * size.width
+        if isinstance(value, str):
+            return cls(size, bytearray(value.encode("ascii")) * count, is_text=True)
+        if isinstance(value, bool):
+            return cls(size, bytearray([value]) * count, is_bool=True)
+        return cls(size, array("i", [value]) * count)
+
+    @property
+    def max_bounds(self):
+        return Coord.from_rc(self.size.height - 1, self.size.width - 1)
+
+    def index(self, coord):
+        """Packed form of a Coord."""
+        return coord.row * self.width + coord.col
+
+    def coord(self, index):
+        """Coord of a packed index."""
+        return Coord.from_rc(*divmod(index, self.width))
+
+    def deltas(self, directions=Coord.DIRECTIONS_CARDINAL):
+        """Packed offsets of directions; only safe where bounds are known."""
+        return [d.row * self.width + d.col for d in directions]
+
+    def neighbor_table(self, directions=Coord.DIRECTIONS_CARDINAL):
+        """
+        Packed neighbours of every cell, shared between grids of one size.
+
+        Entry ``i * len(directions) + d`` is the cell one step from cell i in
+        ``directions[d]``, or -1 where that step leaves the grid.
+        """
+        deltas = tuple((d.row, d.col) for d in directions)
+        return _neighbor_table(self.size.height, self.width, deltas)
+
+    def _encode(self, value):
+        return ord(value) if self.is_text else value
+
+    def _decode(self, value):
+        if self.is_text:
+            return chr(value)
+        return bool(value) if self.is_bool else value
+
+    def _packed(self, key):
+        if type(key) is int:
+            if 0 <= key < len(self.cells):
+                return key
+        elif 0 <= key.row < self.size.height and 0 <= key.col < self.width:
+            return key.row * self.width + key.col
+        raise IndexError(f"{key} is outside the {self.size} grid")
+
+    def __contains__(self, key):
+        if type(key) is int:
+            return 0 <= key < len(self.cells)
+        return 0 <= key.row < self.size.height and 0 <= key.col < self.width
+
+    def __getitem__(self, key):
+        return self._decode(self.cells[self._packed(key)])
+
+    def __setitem__(self, key, value):
+        self.cells[self._packed(key)] = self._encode(value)
+
+    def coords(self):
+        for i, value in enumerate(self.cells):
+            yield self.coord(i), self._decode(value)
+
+    def find_first(self, value):
+        try:
+            return self.coord(self.cells.index(self._encode(value)))
+        except ValueError:
+            return None
+
+    def find_all(self, value):
+        encoded = self._encode(value)
+        return [self.coord(i) for i, v in enumerate(self.cells) if v == encoded]
+
+    def group_by_value(self, exclude=None):
+        groups = {}
+        for coord, value in self.coords():
+            if value != exclude:
+                groups.setdefault(value, []).append(coord)
+        return groups
+
+    def as_numpy(self):
+        """Zero-copy (height, width) NumPy view of the cells."""
+        import numpy as np
+
+        if self.is_bool:
+            dtype = np.bool_
+        else:
+            dtype = np.uint8 if isinstance(self.cells, bytearray) else np.intc
+        return np.frombuffer(self.cells, dtype=dtype).reshape(self.size)
+
+
+@lru_cache(maxsize=16)
+def _neighbor_table(height, width, deltas):
+    table = array("i")
+    for row in range(height):
+        for col in range(width):
+            for dr, dc in deltas:
+                r, c = row + dr, col + dc
+                table.append(r * width + c if 0 <= r < height and 0 <= c < width else -1)
+    return table
@@ -0,0 +1,470 @@
+"""
+Synthetic puzzle inputs of configurable size, for scaling benchmarks.
+
+Every generator takes ``(size, rng)`` and returns the input text; what
+``size`` counts (grid side, lines, digits, bits...) is given per day in
+GENERATORS. Inputs follow the puzzle formats closely enough for the solvers
+to run, but the answers are not known in advance.
+"""
+import random
+import string
+from dataclasses import dataclass, field
+
+
+def _grid_text(rows):
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def _name(rng, taken, length=3, alphabet=string.ascii_lowercase):
+    while (name := "".join(rng.choices(alphabet, k=length))) in taken:
+        pass
+    taken.add(name)
+    return name
+
+
+def historian_hysteria(size, rng):
+    """size: number of rows of location IDs."""
+    return "".join(
+        f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n"
+        for _ in range(size)
+    )
+
+
+def red_nosed_reports(size, rng):
+    """size: number of reports."""
+    lines = []
+    for _ in range(size):
+        level = rng.randint(1, 99)
+        direction = rng.choice((-1, 1))
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            # mostly safe steps, with the odd bad one to exercise the dampener
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-2, 6)
+            level += direction * step
+            levels.append(level)
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines) + "\n"
+
+
+def mull_it_over(size, rng):
+    """size: approximate number of characters of corrupted memory."""
+    noise = "mul(),don't%$#@!^&*[]{}<>?/ 0123456789who+select"
+    chunks, length = [], 0
+    while length < size:
+        choice = rng.random()
+        if choice < 0.05:
+            chunk = rng.choice(("do()", "don't()"))
+        elif choice < 0.3:
+            chunk = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        else:
+            chunk = "".join(rng.choices(noise, k=rng.randint(1, 12)))
+        chunks.append(chunk)
+        length += len(chunk)
+    return "".join(chunks) + "\n"
+
+
+def ceres_search(size, rng):
+    """size: side of the square letter grid."""
+    return _grid_text(rng.choices("XMAS", k=size) for _ in range(size))
+
+
+def print_queue(size, rng):
+    """size: number of page updates (over a fixed set of 49 pages)."""
+    pages = rng.sample(range(10, 100), 49)
+    rules = [
+        f"{pages[i]}|{pages[j]}"
+        for i in range(len(pages))
+        for j in range(i + 1, len(pages))
+    ]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def _guard_leaves(rows, start):
+    """True if the guard walking from start leaves the map without looping."""
+    height, width = len(rows), len(rows[0])
+    directions = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    (row, col), heading = start, 0
+    seen = set()
+    while True:
+        state = (row, col, heading)
+        if state in seen:
+            return False
+        seen.add(state)
+        dr, dc = directions[heading]
+        nr, nc = row + dr, col + dc
+        if not (0 <= nr < height and 0 <= nc < width):
+            return True
+        if rows[nr][nc] == "#":
+            heading = (heading + 1) % 4
+        else:
+            row, col = nr, nc
+
+
+def guard_gallivant(size, rng):
+    """size: side of the square map (regenerated until the guard walks off)."""
+    while True:
+        rows = [
+            ["#" if rng.random() < 0.02 else "." for _ in range(size)]
+            for _ in range(size)
+        ]
+        start = (rng.randrange(size // 4, 3 * size // 4 + 1), rng.randrange(size))
+        rows[start[0]][start[1]] = "^"
+        if _guard_leaves(rows, start):
+            return _grid_text(rows)
+
+
+def bridge_repair(size, rng):
+    """size: number of calibration equations (about half are solvable)."""
+    lines = []
+    for _ in range(size):
+        nums = [rng.randint(1, 99) for _ in range(rng.randint(3, 12))]
+        goal = nums[0]
+        for num in nums[1:]:
+            op = rng.choice("+*|")
+            if op == "+":
+                goal += num
+            elif op == "*":
+                goal *= num
+            else:
+                goal = int(f"{goal}{num}")
+        if rng.random() < 0.5:
+            goal += rng.randint(1, 9)
+        lines.append(f"{goal}: {' '.join(map(str, nums))}")
+    return "\n".join(lines) + "\n"
+
+
+def resonant_collinearity(size, rng):
+    """size: side of the square map (about one antenna per 25 cells)."""
+    frequencies = string.ascii_letters + string.digits
+    return _grid_text(
+        [rng.choice(frequencies) if rng.random() < 0.04 else "." for _ in range(size)]
+        for _ in range(size)
+    )
+
+
+def disk_fragmenter(size, rng):
+    """size: number of digits in the disk map (made odd)."""
+    size |= 1
+    return (
+        "".join(
+            str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9))
+            for i in range(size)
+        )
+        + "\n"
+    )
+
+
+def hoof_it(size, rng):
+    """size: side of the square topographic map."""
+    return _grid_text(rng.choices("0123456789", k=size) for _ in range(size))
+
+
+def plutonian_pebbles(size, rng):
+    """size: number of initial stones."""
+    return " ".join(str(rng.randint(0, 10**6)) for _ in range(size)) + "\n"
+
+
+def garden_groups(size, rng):
+    """size: side of the square garden (blocky regions with ragged edges)."""
+    block = max(2, size // 20)
+    return _grid_text(
+        [
+            chr(65 + ((r // block) * 7 + (c // block) * 3 + rng.randint(0, 1)) % 26)
+            for c in range(size)
+        ]
+        for r in range(size)
+    )
+
+
+def claw_contraption(size, rng):
+    """size: number of claw machines (most of them winnable)."""
+    machines = []
+    for _ in range(size):
+        ax, ay = rng.randint(10, 99), rng.randint(10, 99)
+        bx, by = rng.randint(10, 99), rng.randint(10, 99)
+        a, b = rng.randint(0, 100), rng.randint(0, 100)
+        px, py = a * ax + b * bx, a * ay + b * by
+        if rng.random() < 0.3:
+            px += rng.randint(1, 50)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}"
+        )
+    return "\n\n".join(machines) + "\n"
+
+
+def restroom_redoubt(size, rng):
+    """size: number of robots on the 101x103 floor."""
+    return "".join(
+        f"p={rng.randrange(101)},{rng.randrange(103)}"
+        f" v={rng.randint(-99, 99)},{rng.randint(-99, 99)}\n"
+        for _ in range(size)
+    )
+
+
+def warehouse_woes(size, rng):
+    """size: side of the square warehouse (with 10 moves per cell of side)."""
+    rows = [
+        [
+            "#"
+            if r in (0, size - 1) or c in (0, size - 1) or rng.random() < 0.05
+            else ("O" if rng.random() < 0.25 else ".")
+            for c in range(size)
+        ]
+        for r in range(size)
+    ]
+    rows[size // 2][size // 2] = "@"
+    moves = "".join(rng.choices("<>^v", k=size * 10))
+    move_lines = "\n".join(moves[i : i + 1000] for i in range(0, len(moves), 1000))
+    return _grid_text(rows) + "\n" + move_lines + "\n"
+
+
+def _maze(size, rng, loops):
+    """Perfect maze on an odd-sized grid, with some extra walls knocked out."""
+    size |= 1
+    rows = [["#"] * size for _ in range(size)]
+    stack = [(1, 1)]
+    rows[1][1] = "."
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (r + dr, c + dc, r + dr // 2, c + dc // 2)
+            for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < r + dr < size - 1
+            and 0 < c + dc < size - 1
+            and rows[r + dr][c + dc] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc, wr, wc = rng.choice(options)
+        rows[wr][wc] = rows[nr][nc] = "."
+        stack.append((nr, nc))
+
+    for _ in range(int(size * size * loops)):
+        r, c = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+        rows[r][c] = "."
+    return rows
+
+
+def reindeer_maze(size, rng):
+    """size: side of the square maze (S bottom left, E top right)."""
+    rows = _maze(size, rng, loops=0.02)
+    rows[len(rows) - 2][1] = "S"
+    rows[1][len(rows) - 2] = "E"
+    return _grid_text(rows)
+
+
+def ram_run(size, rng):
+    """size: side of the memory space (half of the cells eventually fall)."""
+    cells = [(x, y) for x in range(size) for y in range(size)]
+    cells.remove((0, 0))
+    cells.remove((size - 1, size - 1))
+    rng.shuffle(cells)
+    return "".join(f"{x},{y}\n" for x, y in cells[: len(cells) // 2])
+
+
+def linen_layout(size, rng):
+    """size: number of designs to check against 400 towel patterns."""
+    colors = "wubrg"
+    patterns = {
+        "".join(rng.choices(colors, k=rng.randint(1, 8))) for _ in range(400)
+    }
+    towels = sorted(patterns)
+    designs = []
+    for _ in range(size):
+        if rng.random() < 0.7:
+            design = ""
+            while len(design) < 40:
+                design += rng.choice(towels)
+        else:
+            design = "".join(rng.choices(colors, k=rng.randint(40, 60)))
+        designs.append(design)
+    return ", ".join(towels) + "\n\n" + "\n".join(designs) + "\n"
+
+
+def race_condition(size, rng):
+    """size: side of the square racetrack (one serpentine track from S to E)."""
+    size = max(size | 1, 5)
+    rows = [["#"] * size for _ in range(size)]
+    track_rows = range(1, size - 1, 2)
+    for i, r in enumerate(track_rows):
+        for c in range(1, size - 1):
+            rows[r][c] = "."
+        if r + 2 < size - 1:
+            # connect to the next track row at alternating ends
+            rows[r + 1][size - 2 if i % 2 == 0 else 1] = "."
+    last = track_rows[-1]
+    rows[1][1] = "S"
+    rows[last][1 if len(track_rows) % 2 == 0 else size - 2] = "E"
+    return _grid_text(rows)
+
+
+def keypad_conundrum(size, rng):
+    """size: number of door codes."""
+    return "".join(f"{rng.randint(0, 999):03d}A\n" for _ in range(size))
+
+
+def monkey_market(size, rng):
+    """size: number of buyers."""
+    return "".join(f"{rng.randint(1, 16777215)}\n" for _ in range(size))
+
+
+def lan_party(size, rng):
+    """size: number of computers (degree about 13, with a planted 13-clique)."""
+    taken = set()
+    names = [_name(rng, taken, length=4) for _ in range(size)]
+    edges = set()
+    for _ in range(size * 6):
+        a, b = rng.sample(names, 2)
+        edges.add((min(a, b), max(a, b)))
+    clique = rng.sample(names, min(13, size))
+    for i, a in enumerate(clique):
+        for b in clique[i + 1 :]:
+            edges.add((min(a, b), max(a, b)))
+    return "".join(f"{a}-{b}\n" for a, b in sorted(edges, key=lambda _: rng.random()))
+
+
+def crossed_wires(size, rng):
+    """
+    size: number of input bits of a ripple-carry adder with four swapped pairs.
+
+    Wire numbers are zero padded to a common width so they still sort in bit
+    order; past 99 bits that is wider than the two digits the part 2 rules
+    look for, so only part 1 stays meaningful there.
+    """
+    size = max(size, 6)
+    width = max(2, len(str(size)))
+    taken = set()
+    gates = []
+
+    def gate(a, op, b, out=None):
+        out = out or _name(rng, taken, alphabet="abcdefghijklmnopqrstuvw")
+        gates.append([a, op, b, out])
+        return len(gates) - 1
+
+    def out(index):
+        return gates[index][3]
+
+    def wire(prefix, bit):
+        return f"{prefix}{bit:0{width}d}"
+
+    carry = out(gate(wire("x", 0), "AND", wire("y", 0)))
+    gate(wire("x", 0), "XOR", wire("y", 0), wire("z", 0))
+    adders = {}
+    for bit in range(1, size):
+        x, y = wire("x", bit), wire("y", bit)
+        half_sum = gate(x, "XOR", y)
+        half_carry = gate(x, "AND", y)
+        total = gate(out(half_sum), "XOR", carry, wire("z", bit))
+        carry_through = gate(out(half_sum), "AND", carry)
+        next_carry = gate(
+            out(half_carry),
+            "OR",
+            out(carry_through),
+            wire("z", size) if bit == size - 1 else None,
+        )
+        adders[bit] = (half_sum, half_carry, total, carry_through, next_carry)
+        carry = out(next_carry)
+
+    # swapping outputs inside one full adder can never create a cycle
+    for bit in rng.sample(range(1, size - 1), 4):
+        half_sum, half_carry, total, carry_through, next_carry = adders[bit]
+        first, second = rng.choice(
+            ((half_sum, half_carry), (total, next_carry), (total, carry_through))
+        )
+        gates[first][3], gates[second][3] = gates[second][3], gates[first][3]
+
+    wires = [f"{wire(w, bit)}: {rng.randint(0, 1)}" for w in "xy" for bit in range(size)]
+    rng.shuffle(gates)
+    return (
+        "\n".join(wires)
+        + "\n\n"
+        + "\n".join(f"{a} {op} {b} -> {o}" for a, op, b, o in gates)
+        + "\n"
+    )
+
+
+def code_chronicle(size, rng):
+    """size: number of lock and key schematics."""
+    schematics = []
+    for _ in range(size):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [
+            "".join("#" if height >= level else "." for height in heights)
+            for level in range(1, 6)
+        ]
+        if rng.random() < 0.5:
+            schematics.append("\n".join(["#####"] + rows + ["....."]))
+        else:
+            schematics.append("\n".join(["....."] + rows[::-1] + ["#####"]))
+    return "\n\n".join(schematics) + "\n"
+
+
+@dataclass(frozen=True)
+class Generator:
+    """How to build one day's input and call its parts for a given size."""
+
+    make: object
+    sizes: tuple
+    # part function name -> extra arguments after the input file, for a size
+    args: dict = field(default_factory=dict)
+
+    def extra_args(self, part, size):
+        extra = self.args.get(part)
+        return extra(size) if extra else ()
+
+
+GENERATORS = {
+    "01": Generator(historian_hysteria, (10**4, 10**5, 10**6)),
+    "02": Generator(red_nosed_reports, (10**3, 10**4, 10**5)),
+    "03": Generator(mull_it_over, (10**5, 10**6, 10**7)),
+    "04": Generator(ceres_search, (140, 280, 560)),
+    "05": Generator(print_queue, (200, 800, 3200)),
+    "06": Generator(guard_gallivant, (130, 500, 2000)),
+    "07": Generator(bridge_repair, (200, 800, 3200)),
+    "08": Generator(resonant_collinearity, (50, 100, 200)),
+    "09": Generator(disk_fragmenter, (2 * 10**3, 2 * 10**4, 10**5)),
+    "10": Generator(hoof_it, (50, 100, 200)),
+    "11": Generator(
+        plutonian_pebbles, (8, 64, 512), {"answer": lambda size: (75,)}
+    ),
+    "12": Generator(garden_groups, (140, 280, 560)),
+    "13": Generator(claw_contraption, (320, 3200, 32000)),
+    "14": Generator(
+        restroom_redoubt,
+        (500, 2000, 8000),
+        {
+            "part1": lambda size: (100, 101, 103),
+            "part2": lambda size: (1000, 101, 103),
+        },
+    ),
+    "15": Generator(warehouse_woes, (50, 100, 200)),
+    "16": Generator(reindeer_maze, (141, 281, 561)),
+    "18": Generator(
+        ram_run,
+        (71, 141, 281),
+        {
+            "part1": lambda size: (size, size * size // 4),
+            "part2": lambda size: (size,),
+        },
+    ),
+    "19": Generator(linen_layout, (400, 1600, 6400)),
+    "20": Generator(race_condition, (141, 281, 561)),
+    "21": Generator(keypad_conundrum, (5, 500, 5000)),
+    "22": Generator(monkey_market, (10**3, 10**4, 10**5)),
+    "23": Generator(lan_party, (520, 5000, 20000)),
+    "24": Generator(crossed_wires, (45, 500, 2000)),
+    "25": Generator(code_chronicle, (500, 2000, 8000)),
+}
+
+
+def generate(day, size, seed=0):
+    """Input text for a day ("6" or "06") of the given size."""
+    return GENERATORS[f"{int(day):02d}"].make(size, random.Random(seed))
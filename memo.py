@@ -0,0 +1,106 @@
+"""
+Bounded memo tables with hit-rate statistics for the recursive solvers.
+
+``BoundedMemo`` is a drop-in for the ``memo`` dicts the solvers pass around:
+
+    memo = BoundedMemo("19 arrangements", maxsize=4096)
+    if key in memo:
+        return memo[key]
+    ...
+    memo[key] = result
+
+A ``key in memo`` test counts as a hit or a miss and refreshes the entry, and
+once a table holds maxsize entries the least recently used one is evicted.
+An optional ``key`` function compacts keys before they are stored. Counters
+are aggregated per name across every table created with it, so a memo built
+per input line still reports as one; ``memo_stats`` returns them and the
+harness (run_all.py, bench.py) prints them per case.
+"""
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    # largest size any single table with this name reached
+    peak_size: int = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_STATS = {}
+
+
+class BoundedMemo:
+    def __init__(self, name, maxsize=None, key=None):
+        """
+        Args:
+            name: Label the statistics are aggregated under
+            maxsize: Most entries to keep, None for unbounded
+            key: Optional function compacting keys before they are stored
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self._key = key
+        self._data = OrderedDict()
+        self.stats = _STATS.setdefault(name, MemoStats())
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        if self._key is not None:
+            key = self._key(key)
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return True
+        self.stats.misses += 1
+        return False
+
+    def __getitem__(self, key):
+        if self._key is not None:
+            key = self._key(key)
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        if self._key is not None:
+            key = self._key(key)
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if self.maxsize is not None and len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.stats.evictions += 1
+        if len(data) > self.stats.peak_size:
+            self.stats.peak_size = len(data)
+
+
+def memo_stats():
+    """Snapshot of the counters of every memo name used so far."""
+    return {
+        name: dict(asdict(stats), hit_rate=stats.hit_rate)
+        for name, stats in _STATS.items()
+    }
+
+
+def reset_memo_stats():
+    # zeroed in place: live tables keep pointing at the same counters
+    for stats in _STATS.values():
+        stats.hits = stats.misses = stats.evictions = stats.peak_size = 0
+
+
+def format_memo_stats(stats):
+    """One line per memo name that was used."""
+    return [
+        f"memo {name}: {s['hits']} hits {s['misses']} misses"
+        f" ({s['hit_rate']:.1%}) {s['evictions']} evictions, peak {s['peak_size']}"
+        for name, s in stats.items()
+        if s["hits"] or s["misses"]
+    ]
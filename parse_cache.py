@@ -0,0 +1,144 @@
+"""
+Opt-in on-disk cache for parsed puzzle inputs.
+
+Set AOC_PARSE_CACHE=1 to enable. ``cached_parse`` wraps a day's parse
+function: results are keyed by the SHA-256 of the input file plus the
+parser's name, the source of its whole module (so its constants and the
+helpers defined next to it count too), the modules defining the parsed
+types (see TYPE_MODULES) and extra arguments. They are pickled
+into .cache/parse and evicted least recently used once the directory grows
+past AOC_PARSE_CACHE_MB megabytes (default 256). With the variable unset the
+parser runs as before.
+"""
+import hashlib
+import importlib
+import os
+import pickle
+import sys
+from functools import cache, wraps
+from pathlib import Path
+
+CACHE_DIR = Path(
+    os.environ.get("AOC_CACHE_DIR", Path(__file__).resolve().parent / ".cache")
+)
+PARSE_DIR = CACHE_DIR / "parse"
+DEFAULT_LIMIT_MB = 256
+# modules whose classes end up in parsed values: a change to any of them can
+# make an old pickle fail to load or load with missing attributes
+TYPE_MODULES = ("aoc", "flat_grid", "numpy")
+
+
+def enabled():
+    return bool(os.environ.get("AOC_PARSE_CACHE"))
+
+
+def limit_bytes():
+    return int(os.environ.get("AOC_PARSE_CACHE_MB", DEFAULT_LIMIT_MB)) * 1024 * 1024
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load(key, directory=None):
+    """Return the value stored under key, raising KeyError on a miss."""
+    path = (directory or PARSE_DIR) / key
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+    except (
+        FileNotFoundError,
+        EOFError,
+        pickle.UnpicklingError,
+        # pickled by a version of a class that no longer matches the code
+        AttributeError,
+        ImportError,
+    ):
+        raise KeyError(key)
+    # mtime doubles as the last-used stamp for LRU eviction
+    os.utime(path)
+    return value
+
+
+def store(key, value, directory=None, limit=None):
+    """Pickle value under key, then evict old entries beyond the size limit."""
+    directory = directory or PARSE_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / key
+    temp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp, path)
+    evict(directory, limit_bytes() if limit is None else limit)
+
+
+def evict(directory, limit):
+    """
+    Delete least recently used entries until directory holds at most limit
+    bytes. Other processes may be storing or evicting at the same time, so
+    their temporary files are left alone and vanished entries are skipped.
+    """
+    entries = []
+    for entry in directory.iterdir():
+        if entry.suffix == ".tmp":
+            continue
+        try:
+            entries.append((entry.stat(), entry))
+        except FileNotFoundError:
+            continue
+    total = sum(stat.st_size for stat, _ in entries)
+    for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+        if total <= limit:
+            break
+        entry.unlink(missing_ok=True)
+        total -= stat.st_size
+
+
+@cache
+def type_modules_digest():
+    """Python version plus the version or source of every TYPE_MODULES entry."""
+    parts = [sys.version]
+    for name in TYPE_MODULES:
+        module = importlib.import_module(name)
+        version = getattr(module, "__version__", None)
+        parts.append(version or file_digest(module.__file__))
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def cache_key(func, data_file, args, kwargs):
+    # the module file rather than the bytecode: co_code leaves out constants
+    # and names, and neither covers the helpers the parser calls
+    source = Path(func.__code__.co_filename)
+    parts = [
+        source.stem,
+        func.__qualname__,
+        file_digest(source),
+        type_modules_digest(),
+        file_digest(data_file),
+        repr(args),
+        repr(sorted(kwargs.items())),
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def cached_parse(func):
+    """Decorate a ``parse(data_file, ...)`` function with the opt-in cache."""
+
+    @wraps(func)
+    def wrapper(data_file, *args, **kwargs):
+        if not enabled():
+            return func(data_file, *args, **kwargs)
+
+        key = cache_key(func, data_file, args, kwargs)
+        try:
+            return load(key)
+        except KeyError:
+            value = func(data_file, *args, **kwargs)
+            store(key, value)
+            return value
+
+    return wrapper
@@ -0,0 +1,119 @@
+"""
+Performance regression gate against a committed baseline of bench timings.
+
+    python3 regress.py [day ...] [--tolerance 0.2] [--update]
+
+Every available case is benchmarked (see bench.py) and compared with the
+baseline by median wall time. To keep timer noise from failing the gate a
+case is only a suspect when both its median and its fastest run are slower
+than the baseline median by more than the tolerance and by more than
+--floor seconds. Suspects are re-measured with twice the repeats and only
+flagged if they are still slow. --update rewrites the baseline instead, and
+writes the first one: timings depend on the machine, so no baseline is
+committed.
+"""
+import argparse
+import json
+import sys
+
+from bench import measure, write_results
+from suites import find_days, load_suites
+
+DEFAULT_BASELINE = "bench_baseline.json"
+DEFAULT_TOLERANCE = 0.2
+DEFAULT_FLOOR = 0.001
+DEFAULT_REPEAT = 7
+
+
+def load_baseline(path):
+    with open(path) as f:
+        results = json.load(f)["results"]
+    return {(r["day"], r["part"], r["input"]): r for r in results}
+
+
+def is_slower(wall, baseline, tolerance, floor):
+    limit = baseline["wall"]["median"] * (1 + tolerance)
+    return all(
+        wall[stat] > limit and wall[stat] - baseline["wall"]["median"] > floor
+        for stat in ("median", "min")
+    )
+
+
+def check(days, baseline, args, report=print):
+    """
+    Benchmark the cases and compare them with the baseline.
+
+    Returns:
+        Tuple of (results, failures) where failures are printable lines
+    """
+    results, failures = [], []
+    for name in days:
+        for suite in load_suites(name):
+            for case in suite.cases:
+                if not case.available:
+                    continue
+
+                result = measure(suite, case, args.repeat, args.warmup)
+                key = (name, suite.part, case.label)
+                reference = baseline.get(key)
+                status = "ok"
+                if not result["correct"]:
+                    status = "WRONG ANSWER"
+                elif reference is None:
+                    status = "new"
+                elif is_slower(result["wall"], reference, args.tolerance, args.floor):
+                    # confirm with a longer run before calling it a regression
+                    result = measure(suite, case, args.repeat * 2, args.warmup)
+                    if is_slower(
+                        result["wall"], reference, args.tolerance, args.floor
+                    ):
+                        status = "SLOWER"
+
+                results.append(result)
+                was = reference["wall"]["median"] if reference else float("nan")
+                line = (
+                    f"{name:28} {suite.part:24} {case.label:24}"
+                    f" {was:10.4f}s -> {result['wall']['median']:10.4f}s  {status}"
+                )
+                report(line)
+                if status in ("SLOWER", "WRONG ANSWER"):
+                    failures.append(line)
+
+    return results, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check for performance regressions.")
+    parser.add_argument("days", nargs="*", help="day numbers, default all")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--floor", type=float, default=DEFAULT_FLOOR)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--update", action="store_true")
+    args = parser.parse_args(argv)
+
+    days = find_days(args.days)
+    if args.update:
+        results, _ = check(days, {}, args)
+        write_results(args.baseline, results, args.repeat, args.warmup)
+        print(f"\nwrote baseline for {len(results)} cases to {args.baseline}")
+        return 0
+
+    try:
+        baseline = load_baseline(args.baseline)
+    except FileNotFoundError:
+        parser.error(
+            f"no baseline at {args.baseline}; record one with --update first"
+        )
+    _, failures = check(days, baseline, args)
+    if failures:
+        print(f"\n{len(failures)} case(s) failed the gate:")
+        print("\n".join(failures))
+        return 1
+    print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
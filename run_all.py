@@ -0,0 +1,169 @@
+"""
+Run the TestCase suites of every day in one interpreter, over a process pool.
+
+    python3 run_all.py [day ...] [--workers N] [--per-case] [--search-stats]
+
+The parent imports aoc once and forks its workers, so the interpreter and
+library start-up is paid a single time instead of once per day file. Days
+run concurrently, but results are streamed back in day order. The summary
+compares the total wall time against the sum of the per-day times.
+
+With --per-case every (part, TestCase) pair is a separate pool task instead
+of every day, so independent parts and inputs of one day run side by side
+(``run_all.py 6 --per-case`` for a single day). Output keeps the same order
+and each day also reports its critical path, the time of its slowest case.
+
+--search-stats (or AOC_SEARCH_STATS=1) prints the work counters of the CSR
+graph searches each case ran, below its memo statistics.
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
+from csr import (
+    enable_search_stats,
+    format_search_stats,
+    reset_search_stats,
+    search_stats,
+)
+from memo import format_memo_stats, memo_stats, reset_memo_stats
+from suites import call, find_days, load_suites
+
+PASS = "pass"
+FAIL = "fail"
+ERROR = "error"
+SKIP = "skip"
+
+# workers replay each day's main block once, however many of its cases they run
+_suites = cache(load_suites)
+
+
+def run_case(name, suite_index, case_index):
+    """
+    Run one case of a day.
+
+    Returns:
+        Tuple of (part, label, status, detail, seconds, memo, search) where
+        memo holds the statistics of the BoundedMemo tables the case used and
+        search those of its graph searches (empty unless search stats are on)
+    """
+    suite = _suites(name)[suite_index]
+    case = suite.cases[case_index]
+    if not case.available:
+        return suite.part, case.label, SKIP, "no input", 0.0, {}, {}
+
+    reset_memo_stats()
+    reset_search_stats()
+    start = time.perf_counter()
+    try:
+        answer = call(suite.func, case)
+    except Exception as e:
+        status, detail = ERROR, f"{type(e).__name__}: {e}"
+    else:
+        status = PASS if answer == case.expected else FAIL
+        detail = repr(answer)
+        if status == FAIL:
+            detail += f" expected {case.expected!r}"
+    elapsed = time.perf_counter() - start
+    return (
+        suite.part,
+        case.label,
+        status,
+        detail,
+        elapsed,
+        memo_stats(),
+        search_stats(),
+    )
+
+
+def case_indices(name):
+    return [
+        (suite_index, case_index)
+        for suite_index, suite in enumerate(_suites(name))
+        for case_index in range(len(suite.cases))
+    ]
+
+
+def run_day(name):
+    """
+    Run all suites of one day.
+
+    Returns:
+        Tuple of (name, case_results, seconds) with one run_case result per case
+    """
+    start = time.perf_counter()
+    results = [run_case(name, *indices) for indices in case_indices(name)]
+    return name, results, time.perf_counter() - start
+
+
+def print_day(name, results, seconds, critical=None):
+    path = f"  critical path {critical:.3f}s" if critical is not None else ""
+    print(f"\033[43m\033[97m  {name}.py  \033[0m {seconds:.3f}s{path}")
+    for part, label, status, detail, elapsed, memo, search in results:
+        print(f"  {status.upper():5} {part:24} {label:24} {elapsed:9.3f}s  {detail}")
+        for line in format_memo_stats(memo) + format_search_stats(search):
+            print(f"        {line}")
+
+
+def run_days(pool, days):
+    """Yield (name, results, seconds, critical path) per day, in day order."""
+    futures = [pool.submit(run_day, name) for name in days]
+    for future in futures:
+        name, results, seconds = future.result()
+        yield name, results, seconds, None
+
+
+def run_cases(pool, days):
+    """Like run_days, with every case of every day submitted as its own task."""
+    submitted = [
+        (name, [pool.submit(run_case, name, *i) for i in case_indices(name)])
+        for name in days
+    ]
+    for name, futures in submitted:
+        results = [future.result() for future in futures]
+        seconds = [result[4] for result in results]
+        yield name, results, sum(seconds), max(seconds, default=0.0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run all day suites in parallel.")
+    parser.add_argument("days", nargs="*", help="day numbers, default all")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--per-case", action="store_true", help="schedule every case separately"
+    )
+    parser.add_argument(
+        "--search-stats", action="store_true", help="count graph search work"
+    )
+    args = parser.parse_args(argv)
+    if args.search_stats:
+        # set before the pool forks, so every worker inherits it
+        enable_search_stats()
+
+    # Imported once here so forked workers inherit it instead of re-importing
+    importlib.import_module("aoc")
+
+    start = time.perf_counter()
+    day_seconds = 0.0
+    failed = False
+    schedule = run_cases if args.per_case else run_days
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for name, results, seconds, critical in schedule(pool, find_days(args.days)):
+            print_day(name, results, seconds, critical)
+            day_seconds += seconds
+            failed |= any(result[2] in (FAIL, ERROR) for result in results)
+
+    wall = time.perf_counter() - start
+    print(
+        f"\nwall {wall:.3f}s  sum of days {day_seconds:.3f}s"
+        f"  speedup {day_seconds / wall:.2f}x on {args.workers} workers"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
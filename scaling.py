@@ -0,0 +1,120 @@
+"""
+Run a day's solvers across a sweep of generated input sizes.
+
+    python3 scaling.py DAY [--sizes N ...] [--seed S] [--output FILE]
+
+Inputs come from generators.py. Each (part, size) runs in a fresh child
+process so its peak RSS is not polluted by earlier runs; wall time, peak RSS
+and RSS growth during the call are recorded, and the printed growth exponent
+between consecutive sizes (time ~ size^k) makes asymptotic regressions stand
+out. Results are written as JSON.
+"""
+import argparse
+import json
+import math
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from generators import GENERATORS, generate
+from suites import find_days, load_day, load_suites
+
+DEFAULT_OUTPUT = "scaling_results.json"
+
+
+def peak_rss_kb():
+    # ru_maxrss is reported in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(name, part, args):
+    """Run one part in this (fresh) process and report time and memory."""
+    func = getattr(load_day(name), part)
+    before = peak_rss_kb()
+    start = time.perf_counter()
+    answer = func(*args)
+    seconds = time.perf_counter() - start
+    peak = peak_rss_kb()
+    return {
+        "seconds": seconds,
+        "peak_rss_kb": peak,
+        "rss_growth_kb": peak - before,
+        "answer": repr(answer),
+    }
+
+
+def growth_exponent(previous, current):
+    if not previous or previous["seconds"] <= 0:
+        return None
+    return math.log(current["seconds"] / previous["seconds"]) / math.log(
+        current["size"] / previous["size"]
+    )
+
+
+def sweep(day, sizes, seed, report=print):
+    (name,) = find_days([day]) or [None]
+    if name is None:
+        raise ValueError(f"no day {day}")
+    generator = GENERATORS[name[:2]]
+    parts = list(dict.fromkeys(suite.part for suite in load_suites(name)))
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        inputs = {}
+        for size in sizes:
+            path = Path(directory) / f"{name[:2]}_generated_{size}"
+            path.write_text(generate(day, size, seed))
+            inputs[size] = str(path)
+
+        # one task per child keeps every peak RSS reading independent
+        with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+            for part in parts:
+                previous = None
+                for size in sizes:
+                    args = (inputs[size], *generator.extra_args(part, size))
+                    result = {"day": name, "part": part, "size": size}
+                    result.update(pool.submit(measure, name, part, args).result())
+                    exponent = growth_exponent(previous, result)
+                    result["exponent"] = exponent
+                    results.append(result)
+                    previous = result
+                    report(format_result(result))
+
+    return results
+
+
+def format_result(result):
+    exponent = result["exponent"]
+    growth = f"n^{exponent:.2f}" if exponent is not None else ""
+    return (
+        f"{result['day']:28} {result['part']:24} size {result['size']:>10}"
+        f" {result['seconds']:10.3f}s {result['peak_rss_kb'] / 1024:9.1f} MiB peak"
+        f" {result['rss_growth_kb'] / 1024:9.1f} MiB growth  {growth}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scale a day over generated inputs.")
+    parser.add_argument("day")
+    parser.add_argument("--sizes", type=int, nargs="+")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    key = f"{int(args.day):02d}"
+    if key not in GENERATORS:
+        parser.error(f"no input generator for day {key}")
+
+    sizes = args.sizes or GENERATORS[key].sizes
+    results = sweep(args.day, sizes, args.seed)
+    with open(args.output, "w") as f:
+        json.dump({"seed": args.seed, "results": results}, f, indent=2)
+    print(f"\nwrote {len(results)} results to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+Long-running solver service on a local Unix socket, and its client.
+
+    python3 serve.py [--socket PATH] start [--workers N] [--no-parse-cache]
+    python3 serve.py [--socket PATH] solve DAY PART INPUT ... [--arg VALUE ...]
+    python3 serve.py [--socket PATH] solve DAY PART --stdin < input
+    python3 serve.py [--socket PATH] stop
+
+``start`` forks a pool of workers that import every day module once, so
+interpreter start-up, imports and module-level caches (memo tables, lazily
+built lookup tables) stay warm between requests; the on-disk parse cache
+(see parse_cache.py) is switched on for the workers unless --no-parse-cache
+is given. Connections are served concurrently and their requests are spread
+over the pool.
+
+The protocol is one JSON object per line each way. A request names the day,
+the part (function name or 1-based index) and either an input "path" or
+base64 "data", plus optional extra "args"; the reply carries the repr of the
+answer and the solve time, or an error. Replies on a connection come back in
+request order, so a client can stream many requests before reading.
+"""
+import argparse
+import base64
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from suites import ROOT, find_days, load_day, parse_arg, resolve_part
+
+DEFAULT_SOCKET = os.environ.get(
+    "AOC_SERVE_SOCKET", str(ROOT / ".cache" / "serve.sock")
+)
+
+
+def warm_worker(use_parse_cache):
+    if use_parse_cache:
+        os.environ.setdefault("AOC_PARSE_CACHE", "1")
+    for name in find_days():
+        load_day(name)
+
+
+def solve(day, part, path, data, args):
+    """Run one request in a worker; returns (answer repr, seconds)."""
+    (name,) = find_days([day]) or [None]
+    if name is None:
+        raise ValueError(f"no day {day}")
+    func = resolve_part(name, part)
+    temp = None
+    if data is not None:
+        temp = tempfile.NamedTemporaryFile(prefix=f"{name[:2]}_", delete=False)
+        with temp:
+            temp.write(base64.b64decode(data))
+        path = temp.name
+    try:
+        start = time.perf_counter()
+        answer = func(path, *args)
+        return repr(answer), time.perf_counter() - start
+    finally:
+        if temp is not None:
+            os.unlink(temp.name)
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # replies are written by a second thread so requests keep being read
+        # (and dispatched to the pool) while earlier ones are still solving
+        pending = queue.Queue()
+        writer = threading.Thread(target=self.write_replies, args=(pending,))
+        writer.start()
+        try:
+            for line in self.rfile:
+                if line.strip():
+                    pending.put(self.dispatch(line))
+        finally:
+            pending.put(None)
+            writer.join()
+
+    def dispatch(self, line):
+        try:
+            request = json.loads(line)
+            if request.get("command") == "shutdown":
+                threading.Thread(target=self.server.shutdown).start()
+                return {"ok": True}
+            return self.server.pool.submit(
+                solve,
+                request["day"],
+                request["part"],
+                request.get("path"),
+                request.get("data"),
+                request.get("args", []),
+            )
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    def write_replies(self, pending):
+        while (item := pending.get()) is not None:
+            if isinstance(item, dict):
+                reply = item
+            else:
+                try:
+                    answer, seconds = item.result()
+                    reply = {"ok": True, "answer": answer, "seconds": seconds}
+                except Exception as e:
+                    reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def start(socket_path, workers, use_parse_cache):
+    path = Path(socket_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=warm_worker, initargs=(use_parse_cache,)
+    ) as pool:
+        # warm_worker runs once in every worker process as it starts. One no-op
+        # task launches the pool (under fork, all workers at once) and returns
+        # after a worker has finished warming up, before requests are accepted
+        pool.submit(int).result()
+        with Server(str(path), Handler) as server:
+            server.pool = pool
+            print(f"serving {len(find_days())} days on {path} with {workers} workers")
+            try:
+                server.serve_forever()
+            finally:
+                path.unlink(missing_ok=True)
+    return 0
+
+
+def request_lines(socket_path, requests):
+    """Send requests over one connection and yield the replies in order."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(b"".join(json.dumps(r).encode() + b"\n" for r in requests))
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as replies:
+            for line in replies:
+                yield json.loads(line)
+
+
+def client_solve(args):
+    extra = [parse_arg(value) for value in args.arg]
+    base = {"day": args.day, "part": args.part, "args": extra}
+    if args.stdin:
+        data = base64.b64encode(sys.stdin.buffer.read()).decode()
+        requests, labels = [dict(base, data=data)], ["<stdin>"]
+    else:
+        # the server may run elsewhere in the tree, so send absolute paths
+        labels = args.inputs
+        requests = [dict(base, path=str(Path(i).resolve())) for i in args.inputs]
+
+    failed = False
+    for label, reply in zip(labels, request_lines(args.socket, requests)):
+        if reply["ok"]:
+            print(f"{label}\t{reply['answer']}\t{reply['seconds']:.4f}s")
+        else:
+            failed = True
+            print(f"{label}\tERROR {reply['error']}")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm solver service.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    start_parser = commands.add_parser("start", help="run the service")
+    start_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    start_parser.add_argument("--no-parse-cache", action="store_true")
+
+    solve_parser = commands.add_parser("solve", help="solve inputs on the service")
+    solve_parser.add_argument("day")
+    solve_parser.add_argument("part", help="function name or 1-based index")
+    solve_parser.add_argument("inputs", nargs="*")
+    solve_parser.add_argument(
+        "--arg", action="append", default=[], help="extra argument, repeatable"
+    )
+    solve_parser.add_argument("--stdin", action="store_true", help="send stdin")
+
+    commands.add_parser("stop", help="shut the service down")
+    args = parser.parse_args(argv)
+
+    if args.command == "start":
+        return start(args.socket, args.workers, not args.no_parse_cache)
+    if args.command == "stop":
+        list(request_lines(args.socket, [{"command": "shutdown"}]))
+        return 0
+    if not args.inputs and not args.stdin:
+        parser.error("give input paths or --stdin")
+    return client_solve(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
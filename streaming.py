@@ -0,0 +1,205 @@
+"""
+Memory-mapped, streaming stand-in for ``aoc.Input``.
+
+``aoc.Input`` reads the whole file into one string and splits it into lists.
+``StreamingInput`` maps the file instead and hands out lines, sections,
+columns and byte slices lazily, so memory stays flat however large the input
+is and the page cache is shared with any other process reading it:
+
+    with StreamingInput(data_file) as data:
+        total = sum(int(line) for line in data.as_lines())
+
+Line and section methods return iterators of ``str`` with the same splitting
+rules as ``Input``, so parsers that iterate over them switch over unchanged.
+``as_bytes`` is a zero-copy view that ``re`` can scan directly, and
+``as_int_array`` (or ``extract_int_array`` on any bytes) pulls every integer
+out in one vectorised pass.
+"""
+import mmap
+
+import numpy as np
+
+# digits of the largest int64; runs this long fit when at most INT64_MAX
+INT64_MAX = np.iinfo(np.int64).max
+MAX_DIGITS = len(str(INT64_MAX))
+_DIGIT_POWERS = 10 ** np.arange(MAX_DIGITS, dtype=np.int64)
+_MAX_DIGIT_VALUES = np.array([int(d) for d in str(INT64_MAX)], dtype=np.int64)
+
+
+def extract_int_array(data, rows=False):
+    """
+    Every integer in data, like ``aoc.extract_ints`` (``-?\\d+``) in one pass.
+
+    The bytes are scanned with NumPy instead of a regex and one ``int()`` per
+    match: digit runs are found from a digit mask, and each run's value is a
+    segmented sum of digit times power of ten. Values are int64, so unlike
+    ``aoc.extract_ints`` they are limited to ``|value| <= INT64_MAX``, at most
+    MAX_DIGITS (19) digits; larger ones raise OverflowError instead of wrapping.
+
+    Args:
+        data: bytes-like object (bytes, memoryview, mmap)
+        rows: Also return where each line's numbers start
+
+    Returns:
+        int64 array of the values; with rows, a tuple of (values, offsets)
+        where line i holds ``values[offsets[i]:offsets[i + 1]]``
+
+    Raises:
+        OverflowError: A digit run's value is greater than INT64_MAX
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (buffer >= ord("0")) & (buffer <= ord("9"))
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    digits = buffer[is_digit].astype(np.int64) - ord("0")
+    # power of ten of every digit within its run, counting from the run's end
+    run_lengths = ends - starts
+    too_long = run_lengths > MAX_DIGITS
+    longest = run_lengths == MAX_DIGITS
+    if longest.any():
+        # compare full-length runs with INT64_MAX digit by digit: the first
+        # digit that differs decides, and equal runs are INT64_MAX itself
+        run_digits = buffer[starts[longest, None] + np.arange(MAX_DIGITS)] - ord("0")
+        differ = run_digits != _MAX_DIGIT_VALUES
+        first = np.argmax(differ, axis=1)
+        above = differ.any(axis=1) & (
+            run_digits[np.arange(len(run_digits)), first] > _MAX_DIGIT_VALUES[first]
+        )
+        too_long[longest] = above
+    if too_long.any():
+        at = starts[np.argmax(too_long)]
+        raise OverflowError(
+            f"integer at byte {at} does not fit in int64, whose largest value"
+            f" is {INT64_MAX}"
+        )
+    run_ends = np.cumsum(run_lengths)
+    place = np.repeat(run_ends, run_lengths) - np.arange(len(digits)) - 1
+    values = (
+        np.add.reduceat(digits * _DIGIT_POWERS[place], run_ends - run_lengths)
+        if len(starts)
+        else np.zeros(0, dtype=np.int64)
+    )
+    negative = starts > 0
+    negative[negative] = buffer[starts[negative] - 1] == ord("-")
+    values[negative] *= -1
+
+    if not rows:
+        return values
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    first = np.zeros(1 if len(buffer) else 0, dtype=np.intp)
+    line_starts = np.concatenate((first, newlines[newlines < len(buffer) - 1] + 1))
+    offsets = np.append(np.searchsorted(starts, line_starts), len(values))
+    return values, offsets
+
+
+class StreamingInput:
+    def __init__(self, file=None, _buffer=None, _start=0, _stop=None):
+        self._file = None
+        if _buffer is None:
+            self._file = open(file, "rb")
+            try:
+                _buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                _buffer = b""
+        self._buffer = _buffer
+        self._start = _start
+        self._stop = len(_buffer) if _stop is None else _stop
+
+    def close(self):
+        if self._file is not None:
+            if isinstance(self._buffer, mmap.mmap):
+                self._buffer.close()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._stop - self._start
+
+    @property
+    def content(self):
+        """Whole text as one string; this copies, prefer the lazy methods."""
+        return self.as_bytes().tobytes().decode().strip()
+
+    def as_bytes(self):
+        """Zero-copy memoryview of the raw bytes."""
+        return memoryview(self._buffer)[self._start : self._stop]
+
+    def as_int_array(self, rows=False):
+        """Every integer, see extract_int_array."""
+        return extract_int_array(self.as_bytes(), rows)
+
+    def slices(self, size):
+        """Zero-copy memoryviews of consecutive chunks of at most size bytes."""
+        view = self.as_bytes()
+        for start in range(0, len(view), size):
+            yield view[start : start + size]
+
+    def _line_spans(self):
+        buffer, position, stop = self._buffer, self._start, self._stop
+        while position < stop:
+            end = buffer.find(b"\n", position, stop)
+            if end < 0:
+                end = stop
+            # CRLF files: the \r is part of the line ending, not the line
+            if end > position and buffer[end - 1] == ord("\r"):
+                yield position, end - 1
+            else:
+                yield position, end
+            position = end + 1
+
+    def as_lines(self):
+        """
+        Lines without their line ending, skipping leading and trailing blank
+        lines the way ``Input`` strips its content.
+        """
+        # None until the first non-blank line, then the blank lines pending
+        blank = None
+        for start, end in self._line_spans():
+            if start == end:
+                # only emit blank lines once a later line proves they are inner
+                if blank is not None:
+                    blank += 1
+                continue
+            yield from [""] * (blank or 0)
+            blank = 0
+            yield self._buffer[start:end].decode()
+
+    def as_sections(self):
+        """Views of the blank-line separated sections, valid while this is open."""
+        section_start = None
+        last_end = None
+        for start, end in self._line_spans():
+            if start == end:
+                if section_start is not None:
+                    yield StreamingInput(None, self._buffer, section_start, last_end)
+                    section_start = None
+                continue
+            if section_start is None:
+                section_start = start
+            last_end = end
+        if section_start is not None:
+            yield StreamingInput(None, self._buffer, section_start, last_end)
+
+    def as_columns(self, separator=" ", converter=str):
+        """
+        Split every line on separator and transpose into lists of columns.
+
+        The lines are streamed, so only the converted values are held.
+        """
+        columns = []
+        for line in self.as_lines():
+            values = line.split(separator)
+            if not columns:
+                columns = [[] for _ in values]
+            for column, value in zip(columns, values):
+                column.append(converter(value))
+        return columns
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# the day files and helper modules live at the top level, not in a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
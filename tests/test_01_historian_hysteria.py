@@ -0,0 +1,36 @@
+import tracemalloc
+
+import generators
+from suites import load_day
+
+day = load_day("01_historian_hysteria")
+
+
+def test_external_sort_matches_in_memory(tmp_path):
+    path = tmp_path / "input"
+    path.write_text(generators.generate("01", 5_000, seed=1))
+    expected = day.part1(str(path))
+    for budget in (1 << 12, 1 << 20):
+        assert day.part1(str(path), budget) == expected
+
+
+def traced_peak(func, *args):
+    tracemalloc.start()
+    try:
+        return func(*args), tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_external_sort_stays_within_budget(tmp_path):
+    path = tmp_path / "input"
+    # 3.2 MB of rows, a dozen times the budget
+    path.write_text(generators.generate("01", 200_000, seed=1))
+    budget = 256 * 1024
+    expected, in_memory_peak = traced_peak(day.part1, str(path))
+    answer, peak = traced_peak(day.part1, str(path), budget)
+    assert answer == expected
+    # the overhead constants are estimates, so allow them to be off by the
+    # budget again; the in-memory parse needs several times more either way
+    assert peak <= 2 * budget
+    assert peak * 4 <= in_memory_peak
@@ -0,0 +1,37 @@
+import random
+
+import numpy as np
+
+from suites import load_day
+
+day = load_day("02_red_nosed_reports")
+
+
+def random_reports(count, seed):
+    rng = random.Random(seed)
+    reports = []
+    for _ in range(count):
+        report = [rng.randint(0, 20)]
+        for _ in range(rng.randint(0, 8) - 1):
+            report.append(report[-1] + rng.choice([1, 2, 3, -1, 0, 4, 2, -2, 5]))
+        reports.append(report[::-1] if rng.random() < 0.5 else report)
+    return reports
+
+
+def test_safe_reports_matches_scalar_checks():
+    reports = random_reports(20_000, seed=5)
+    values = np.array([level for report in reports for level in report])
+    ends = np.cumsum([len(report) for report in reports])
+    starts = ends - [len(report) for report in reports]
+
+    safe = day.safe_reports(values, starts, ends)
+    assert safe.tolist() == [day.is_safe(report) for report in reports]
+    safe = day.safe_reports(values, starts, ends, dampened=True)
+    assert safe.tolist() == [day.is_safe_dampered(report) for report in reports]
+
+
+def test_parse_ragged_drops_blank_lines(tmp_path):
+    path = tmp_path / "input"
+    path.write_text("7 6 4\n\n1 2\n\n")
+    values, starts, ends = day.parse_ragged(str(path))
+    assert [values[s:e].tolist() for s, e in zip(starts, ends)] == [[7, 6, 4], [1, 2]]
@@ -0,0 +1,18 @@
+from aoc import Coord
+
+from suites import load_day
+
+day = load_day("18_ram_run")
+
+
+def test_blocked_exit_is_the_blocking_byte():
+    # the exit itself falls first, before either of its neighbours
+    bytes_ = [Coord(6, 6), Coord(1, 0), Coord(0, 1)]
+    assert day.find_blocking_byte(7, bytes_) == "6,6"
+
+
+def test_blocked_start_is_the_blocking_byte():
+    bytes_ = [Coord(5, 5), Coord(0, 0), Coord(6, 5)]
+    assert day.find_blocking_byte(7, bytes_) == "0,0"
+    grid = day.simulate_memory_space(7, bytes_, 2)
+    assert day.find_shortest_path(grid) == -1
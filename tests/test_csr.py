@@ -0,0 +1,78 @@
+import random
+from array import array
+
+import pytest
+from aoc import Dimension
+
+from csr import (
+    UNREACHED,
+    CSRGraph,
+    astar,
+    bfs,
+    bidirectional_bfs,
+    compile_grid,
+    dijkstra,
+    manhattan,
+)
+from flat_grid import FlatGrid
+
+
+def random_space(rng):
+    size = Dimension(rng.randint(1, 12), rng.randint(1, 12))
+    space = FlatGrid.create(size, ".")
+    density = rng.random() * 0.5
+    blocked = bytearray(rng.random() < density for _ in space.cells)
+    return space, compile_grid(space, {"."}), blocked
+
+
+def masked_weights(graph, blocked, rng):
+    """graph with blocked nodes cut off and random small edge weights."""
+    offsets, targets, weights = array("i", [0]), array("i"), array("i")
+    for node in range(graph.node_count):
+        for target, _ in graph.neighbors(node):
+            if not blocked[node] and not blocked[target]:
+                targets.append(target)
+                weights.append(rng.randint(1, 9))
+        offsets.append(len(targets))
+    return CSRGraph(offsets, targets, weights)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_point_searches_match_full_bfs(seed):
+    rng = random.Random(seed)
+    space, graph, blocked = random_space(rng)
+    for _ in range(10):
+        start, target = (rng.randrange(len(space.cells)) for _ in range(2))
+        expected = bfs(graph, start, blocked)[target]
+        if blocked[target]:
+            assert expected == UNREACHED
+
+        heuristic = manhattan(space, target)
+        assert astar(graph, start, target, heuristic, blocked) == expected
+        assert bidirectional_bfs(graph, start, target, blocked) == expected
+        assert bfs(graph, start, blocked, target)[target] == expected
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_bucket_dijkstra_matches_heap(seed):
+    rng = random.Random(seed)
+    space, graph, blocked = random_space(rng)
+    weighted = masked_weights(graph, blocked, rng)
+    start = rng.randrange(len(space.cells))
+    expected = dijkstra(weighted, start, "heap")
+    assert dijkstra(weighted, start, "bucket") == expected
+    for target in rng.sample(range(len(space.cells)), min(5, len(space.cells))):
+        distances = dijkstra(weighted, start, "bucket", target)
+        assert distances[target] == expected[target]
+
+
+def test_blocked_start_or_target_is_unreachable():
+    space = FlatGrid.create(Dimension(3, 3), ".")
+    graph = compile_grid(space, {"."})
+    end = len(space.cells) - 1
+    for cell in (0, end):
+        blocked = bytearray(len(space.cells))
+        blocked[cell] = 1
+        assert astar(graph, 0, end, manhattan(space, end), blocked) == UNREACHED
+        assert bidirectional_bfs(graph, 0, end, blocked) == UNREACHED
+        assert bfs(graph, 0, blocked)[end] == UNREACHED
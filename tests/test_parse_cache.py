@@ -0,0 +1,92 @@
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import parse_cache
+
+PARSER = '''
+from parse_cache import cached_parse
+
+
+@cached_parse
+def parse(data_file):
+    guard_char = "{guard}"
+    with open(data_file) as f:
+        return f.read().count(guard_char)
+'''
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_PARSE_CACHE", "1")
+    monkeypatch.setattr(parse_cache, "PARSE_DIR", tmp_path / "parse")
+    return tmp_path / "parse"
+
+
+def load_parser(path, guard):
+    path.write_text(PARSER.format(guard=guard))
+    spec = importlib.util.spec_from_file_location("parser_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.parse
+
+
+def test_cached_parse_hits(tmp_path, cache_dir):
+    data = tmp_path / "input"
+    data.write_text("^^>")
+    parse = load_parser(tmp_path / "parser.py", "^")
+    assert parse(str(data)) == 2
+    assert len(list(cache_dir.iterdir())) == 1
+    assert parse(str(data)) == 2
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_changing_a_parser_constant_invalidates(tmp_path, cache_dir):
+    data = tmp_path / "input"
+    data.write_text("^^>")
+    assert load_parser(tmp_path / "parser.py", "^")(str(data)) == 2
+    # same bytecode, only the constant differs
+    assert load_parser(tmp_path / "parser.py", ">")(str(data)) == 1
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_changing_a_type_module_invalidates(tmp_path, cache_dir, monkeypatch):
+    data = tmp_path / "input"
+    data.write_text("^^>")
+    parse = load_parser(tmp_path / "parser.py", "^")
+    assert parse(str(data)) == 2
+    monkeypatch.setattr(parse_cache, "type_modules_digest", lambda: "changed")
+    assert parse(str(data)) == 2
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_pickle_of_a_removed_class_is_a_miss(tmp_path, monkeypatch):
+    module = types.ModuleType("vanishing_types")
+    exec("class Parsed:\n    pass\n", module.__dict__)
+    module.Parsed.__module__ = module.__name__
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    parse_cache.store("key", module.Parsed(), tmp_path)
+    del module.Parsed
+    with pytest.raises(KeyError):
+        parse_cache.load("key", tmp_path)
+
+
+def test_evict_leaves_temporary_files_alone(tmp_path):
+    (tmp_path / "old").write_bytes(bytes(100))
+    (tmp_path / "new").write_bytes(bytes(100))
+    os.utime(tmp_path / "old", (0, 0))
+    (tmp_path / "new.123.tmp").write_bytes(bytes(1000))
+    parse_cache.evict(tmp_path, 150)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new", "new.123.tmp"]
+
+
+def test_evict_skips_entries_removed_meanwhile(tmp_path, monkeypatch):
+    (tmp_path / "gone").write_bytes(bytes(100))
+    entries = list(tmp_path.iterdir())
+    (tmp_path / "gone").unlink()
+    monkeypatch.setattr(Path, "iterdir", lambda self: iter(entries))
+    parse_cache.evict(tmp_path, 0)
@@ -0,0 +1,50 @@
+import re
+
+import pytest
+
+from streaming import INT64_MAX, MAX_DIGITS, StreamingInput, extract_int_array
+
+
+def test_extract_int_array_matches_regex():
+    data = b"p=0,4 v=-3,-3\n\nmul(12,345)-x 999999999999999999\n-7"
+    expected = [int(match) for match in re.findall(rb"-?\d+", data)]
+    assert extract_int_array(data).tolist() == expected
+
+
+def test_extract_int_array_rows():
+    values, offsets = extract_int_array(b"1 2\n\n3\n", rows=True)
+    assert values.tolist() == [1, 2, 3]
+    assert offsets.tolist() == [0, 2, 2, 3]
+    values, offsets = extract_int_array(b"", rows=True)
+    assert values.tolist() == [] and offsets.tolist() == [0]
+
+
+def test_extract_int_array_longest_run():
+    assert MAX_DIGITS == 19
+    for largest in (INT64_MAX, INT64_MAX - 1, int("9" * (MAX_DIGITS - 1))):
+        data = b"-%d %d" % (largest, largest)
+        assert extract_int_array(data).tolist() == [-largest, largest]
+    assert extract_int_array(b"1000000000000000000").tolist() == [10**18]
+
+
+@pytest.mark.parametrize(
+    "value", [INT64_MAX + 1, 9300000000000000000, int("9" * 19), 10**19, 10**40]
+)
+def test_extract_int_array_rejects_values_beyond_int64(value):
+    with pytest.raises(OverflowError):
+        extract_int_array(b"1 %d 2" % value)
+
+
+def test_as_int_array(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(b"3   4\n4   3\n")
+    with StreamingInput(path) as data:
+        assert data.as_int_array().tolist() == [3, 4, 4, 3]
+
+
+def test_as_lines_strips_like_input(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(b"\r\n\n12\r\n\r\n34\r\n\n\n")
+    with StreamingInput(path) as data:
+        assert list(data.as_lines()) == ["12", "", "34"]
+        assert [list(s.as_lines()) for s in data.as_sections()] == [["12"], ["34"]]